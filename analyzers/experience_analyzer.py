@@ -1,13 +1,168 @@
 """
 Experience Analyzer for Resume Intelligence Engine
 """
-from typing import Dict, List, Optional, Tuple
+import re
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
-from config.config import EXPERIENCE_THRESHOLDS, SKILL_CATEGORIES
+from config.config import SKILL_CATEGORIES, level_for_years
+from utils.keyword_matcher import KeywordMatcher
+from utils.compat import DATACLASS_SLOTS
 
 
-@dataclass
+# Duration patterns, compiled once at import
+_DATE_RE = re.compile(
+    r'(\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s*\d{2,4}|'
+    r'\d{1,2}/\d{2,4}|\d{4})\s*[-–—to]+\s*'
+    r'(\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s*\d{2,4}|'
+    r'\d{1,2}/\d{2,4}|\d{4}|present|current|now)',
+    re.IGNORECASE
+)
+_YEAR_RE = re.compile(r'(\d+)\+?\s*(?:years?|yrs?)', re.IGNORECASE)
+_MONTH_RE = re.compile(r'(\d+)\s*(?:months?|mos?)', re.IGNORECASE)
+_YEAR_RANGE_RE = re.compile(r'(\d{4})\s*[-–—]\s*(\d{4})')
+_YEAR4_RE = re.compile(r'\b(19|20)\d{2}\b')
+_PRESENT_RE = re.compile(r'present|current|now', re.IGNORECASE)
+
+# Keywords for domain identification
+_DOMAIN_KEYWORDS = {
+    "technology": ("software", "web", "mobile", "cloud", "devops", "ai", "ml", "data", "software development"),
+    "finance": ("banking", "fintech", "trading", "investment", "financial", "accounting"),
+    "healthcare": ("health", "medical", "pharma", "clinical", "patient", "ehr", "hipaa"),
+    "ecommerce": ("e-commerce", "retail", "online", "marketplace", "shopping"),
+    "marketing": ("marketing", "digital", "seo", "content", "advertising", "brand"),
+    "education": ("education", "e-learning", "courses", "training", "academic"),
+    "consulting": ("consulting", "advisory", "strategy", "management"),
+    "government": ("government", "public", "federal", "state", "policy"),
+    "manufacturing": ("manufacturing", "production", "supply chain", "logistics"),
+    "telecom": ("telecom", "networking", "wireless", "5g", "isp"),
+}
+
+# Keywords for role identification
+_ROLE_KEYWORDS = {
+    "developer": ("developer", "engineer", "programmer", "coder"),
+    "designer": ("designer", "ui", "ux", "creative"),
+    "analyst": ("analyst", "analytics", "insights"),
+    "manager": ("manager", "lead", "head", "director", "vp"),
+    "architect": ("architect", "principal", "staff"),
+    "consultant": ("consultant", "advisor"),
+    "researcher": ("researcher", "scientist", "research"),
+    "administrator": ("administrator", "admin", "operations"),
+}
+
+# Role types in priority order, first listed wins
+_ROLE_PRIORITY = {role_type: rank for rank, role_type in enumerate(_ROLE_KEYWORDS)}
+
+# Company type indicators
+_COMPANY_KEYWORDS = {
+    "startup": ("startup", "seed", "series", "ycombinator"),
+    "enterprise": ("enterprise", "fortune", "fortune 500", "multinational"),
+    "mid_size": ("mid-size", "mid-market", "growing"),
+    "agency": ("agency", "consulting firm"),
+    "non_profit": ("non-profit", "nonprofit", "foundation", "ngo"),
+    "government": ("government", "federal", "state", "city"),
+    "academic": ("university", "college", "research institution"),
+}
+
+# Leadership indicators
+_LEADERSHIP_KEYWORDS = (
+    "led", "managed", "mentored", "directed", "headed", "oversaw",
+    "supervised", "coordinated", "spearheaded", "championed", "built team",
+)
+
+# Seniority indicators in role titles
+_SENIOR_KEYWORDS = ("senior", "sr", "lead", "principal", "staff", "head", "director", "vp", "chief")
+_JUNIOR_KEYWORDS = ("junior", "jr", "associate", "entry", "intern", "trainee")
+
+# Career level names that differ from the config threshold names
+_CAREER_LEVEL_LABELS = {"mid": "mid-level"}
+
+# Complex technology indicators in experience descriptions
+_COMPLEX_TECHS = ("microservices", "distributed", "scalable", "enterprise",
+                  "high-traffic", "real-time", "machine learning", "ai")
+
+# Multi-keyword matchers, built once per keyword group. Domain, role and company
+# keywords may run on into a longer word ("health" in "healthcare", "developer"
+# in "developers", "startup" in "StartupXYZ") but must start one, so "ngo" never
+# matches inside "mongodb"
+_DOMAIN_MATCHER = KeywordMatcher.from_mapping(_DOMAIN_KEYWORDS, word_starts=True)
+_ROLE_MATCHER = KeywordMatcher.from_mapping(_ROLE_KEYWORDS, word_starts=True)
+_COMPANY_MATCHER = KeywordMatcher.from_mapping(_COMPANY_KEYWORDS, word_starts=True)
+_LEADERSHIP_MATCHER = KeywordMatcher.from_mapping({True: _LEADERSHIP_KEYWORDS}, whole_words=True)
+_SENIORITY_MATCHER = KeywordMatcher.from_mapping({
+    "senior": _SENIOR_KEYWORDS,
+    "junior": _JUNIOR_KEYWORDS,
+}, whole_words=True)
+_COMPLEX_TECH_MATCHER = KeywordMatcher(((tech, tech) for tech in _COMPLEX_TECHS), whole_words=True)
+
+
+def _extract_year(date_str: str, current_year: int) -> Optional[int]:
+    """Extract year from date string"""
+    match = _YEAR4_RE.search(date_str)
+    if match:
+        return int(match.group())
+    
+    # Handle present/current
+    if _PRESENT_RE.search(date_str):
+        return current_year
+    
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_duration_months(duration: str, current_year: int) -> Optional[int]:
+    """Parse a duration string to months, resolving "present" to current_year"""
+    # Pattern for date ranges
+    match = _DATE_RE.search(duration)
+    if match:
+        start_date = match.group(1)
+        end_date = match.group(2)
+        
+        start_year = _extract_year(start_date, current_year)
+        end_year = _extract_year(end_date, current_year)
+        
+        if start_year and end_year:
+            months = (end_year - start_year) * 12
+            return max(months, 0)
+    
+    # Try to find years directly
+    match = _YEAR_RE.search(duration)
+    if match:
+        return int(match.group(1)) * 12
+    
+    # Try to find months
+    match = _MONTH_RE.search(duration)
+    if match:
+        return int(match.group(1))
+    
+    # Look for year ranges like "2020 - 2023"
+    match = _YEAR_RANGE_RE.search(duration)
+    if match:
+        start = int(match.group(1))
+        end = int(match.group(2))
+        if end >= start:
+            return (end - start) * 12
+    
+    return None
+
+
+# (output key, attribute) pairs for ExperienceProfile.to_dict
+_PROFILE_FIELD_MAP = (
+    ("total_years_experience", "total_years"),
+    ("career_level", "career_level"),
+    ("domain_expertise", "domain_expertise"),
+    ("role_specialization", "role_specialization"),
+    ("industry_history", "industry_history"),
+    ("company_types", "company_types"),
+    ("leadership_experience", "leadership_experience"),
+    ("project_complexity", "project_complexity"),
+    ("career_progression", "career_progression"),
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ExperienceProfile:
     """Complete experience profile for a candidate"""
     total_years: float = 0
@@ -18,324 +173,221 @@ class ExperienceProfile:
     company_types: List[str] = field(default_factory=list)
     leadership_experience: bool = False
     project_complexity: str = ""
-    career_progression: List[Dict] = field(default_factory=list)
+    
+    # Career progression stored column-wise, one entry per experience
+    progression_roles: Tuple[str, ...] = ()
+    progression_companies: Tuple[str, ...] = ()
+    progression_durations: Tuple[str, ...] = ()
+    progression_levels: Tuple[str, ...] = ()
+    
+    @property
+    def career_progression(self) -> List[Dict]:
+        """Career progression as one dict per experience"""
+        return [
+            {
+                "role": role,
+                "company": company,
+                "duration": duration,
+                "level": level,
+                "sequence": sequence
+            }
+            for sequence, (role, company, duration, level) in enumerate(
+                zip(self.progression_roles, self.progression_companies,
+                    self.progression_durations, self.progression_levels),
+                start=1
+            )
+        ]
     
     def to_dict(self) -> Dict:
-        return {
-            "total_years_experience": self.total_years,
-            "career_level": self.career_level,
-            "domain_expertise": self.domain_expertise,
-            "role_specialization": self.role_specialization,
-            "industry_history": self.industry_history,
-            "company_types": self.company_types,
-            "leadership_experience": self.leadership_experience,
-            "project_complexity": self.project_complexity,
-            "career_progression": self.career_progression
-        }
+        # Lists are copied so edits to the dict never reach the profile
+        result = {}
+        for key, attr in _PROFILE_FIELD_MAP:
+            value = getattr(self, attr)
+            result[key] = list(value) if isinstance(value, list) else value
+        return result
+
+
+@dataclass
+class _ExperienceScan:
+    """Per-experience aggregates gathered in one pass over the experiences"""
+    total_months: int = 0
+    has_senior: bool = False
+    has_junior: bool = False
+    role_type: Optional[str] = None
+    company_types: List[str] = field(default_factory=list)
+    has_leadership: bool = False
+    complexity_score: int = 0
+    roles: List[str] = field(default_factory=list)
+    companies: List[str] = field(default_factory=list)
+    durations: List[str] = field(default_factory=list)
+    levels: List[str] = field(default_factory=list)
 
 
 class ExperienceAnalyzer:
     """Analyze work experience from resume data"""
     
-    # Keywords for domain identification
-    DOMAIN_KEYWORDS = {
-        "technology": ["software", "web", "mobile", "cloud", "devops", "ai", "ml", "data", "software development"],
-        "finance": ["banking", "fintech", "trading", "investment", "financial", "accounting"],
-        "healthcare": ["health", "medical", "pharma", "clinical", "patient", "ehr", "hipaa"],
-        "ecommerce": ["e-commerce", "retail", "online", "marketplace", "shopping"],
-        "marketing": ["marketing", "digital", "seo", "content", "advertising", "brand"],
-        "education": ["education", "e-learning", "courses", "training", "academic"],
-        "consulting": ["consulting", "advisory", "strategy", "management"],
-        "government": ["government", "public", "federal", "state", "policy"],
-        "manufacturing": ["manufacturing", "production", "supply chain", "logistics"],
-        "telecom": ["telecom", "networking", "wireless", "5g", "isp"],
-    }
-    
-    # Keywords for role identification
-    ROLE_KEYWORDS = {
-        "developer": ["developer", "engineer", "programmer", "coder"],
-        "designer": ["designer", "ui", "ux", "creative"],
-        "analyst": ["analyst", "analytics", "insights"],
-        "manager": ["manager", "lead", "head", "director", "vp"],
-        "architect": ["architect", "principal", "staff"],
-        "consultant": ["consultant", "advisor"],
-        "researcher": ["researcher", "scientist", "research"],
-        "administrator": ["administrator", "admin", "operations"],
-    }
-    
-    # Company type indicators
-    COMPANY_KEYWORDS = {
-        "startup": ["startup", "seed", "series", "ycombinator"],
-        "enterprise": ["enterprise", "fortune", "fortune 500", "multinational"],
-        "mid_size": ["mid-size", "mid-market", "growing"],
-        "agency": ["agency", "consulting firm"],
-        "non_profit": ["non-profit", "nonprofit", "foundation", "ngo"],
-        "government": ["government", "federal", "state", "city"],
-        "academic": ["university", "college", "research institution"],
-    }
-    
-    # Leadership indicators
-    LEADERSHIP_KEYWORDS = [
-        "led", "managed", "mentored", "directed", "headed", "oversaw",
-        "supervised", "coordinated", "spearheaded", "championed", "built team"
-    ]
-    
-    # Seniority indicators in role titles
-    SENIOR_KEYWORDS = ["senior", "sr", "lead", "principal", "staff", "head", "director", "vp", "chief"]
-    JUNIOR_KEYWORDS = ["junior", "jr", "associate", "entry", "intern", "trainee", "trainee"]
+    # Keyword tables (module-level tuples, kept here for callers that read them)
+    DOMAIN_KEYWORDS = _DOMAIN_KEYWORDS
+    ROLE_KEYWORDS = _ROLE_KEYWORDS
+    COMPANY_KEYWORDS = _COMPANY_KEYWORDS
+    LEADERSHIP_KEYWORDS = _LEADERSHIP_KEYWORDS
+    SENIOR_KEYWORDS = _SENIOR_KEYWORDS
+    JUNIOR_KEYWORDS = _JUNIOR_KEYWORDS
     
     def __init__(self):
         pass
     
+    @classmethod
+    def analyze_batch(cls, resumes, workers: Optional[int] = None) -> List[ExperienceProfile]:
+        """Analyze many resumes in parallel worker processes"""
+        resumes = list(resumes)
+        
+        # A process pool only pays off with more than one resume and worker
+        if len(resumes) < 2 or workers == 1:
+            analyzer = cls()
+            return [analyzer.analyze_experience(resume) for resume in resumes]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_analyze_experience_worker, resumes))
+    
     def analyze_experience(self, resume_data) -> ExperienceProfile:
         """Analyze all experience data from resume"""
         profile = ExperienceProfile()
+        experiences = resume_data.experiences
+        
+        # Resolve "present" against one year for the whole analysis
+        current_year = datetime.now().year
+        
+        # Gather every per-experience aggregate in one pass
+        scan = self._scan_experiences(experiences, current_year)
         
         # Calculate total years
-        profile.total_years = self._calculate_total_years(resume_data.experiences)
+        profile.total_years = round(scan.total_months / 12, 1) if experiences else 0
         
         # Determine career level based on experience
         profile.career_level = self._determine_career_level(profile.total_years)
         
         # Also check role titles for seniority indicators
-        role_level = self._determine_level_from_roles(resume_data.experiences)
+        role_level = self._determine_level_from_roles(experiences, scan)
         if role_level != "mid":
             profile.career_level = role_level
         
-        # Identify domain expertise
-        profile.domain_expertise = self._identify_domains(resume_data)
+        # Identify domain expertise (industry history uses the same keywords)
+        domains = self._identify_domains(self._get_full_text_lower(resume_data))
+        profile.domain_expertise = domains
+        profile.industry_history = list(domains)
         
         # Identify role specialization
-        profile.role_specialization = self._identify_role(resume_data)
-        
-        # Industry history
-        profile.industry_history = self._identify_industries(resume_data)
+        profile.role_specialization = self._identify_role(resume_data, scan)
         
         # Company types
-        profile.company_types = self._identify_company_types(resume_data)
+        profile.company_types = list(dict.fromkeys(scan.company_types))
         
         # Leadership experience
-        profile.leadership_experience = self._check_leadership(resume_data)
+        profile.leadership_experience = scan.has_leadership
         
         # Project complexity
-        profile.project_complexity = self._assess_complexity(resume_data)
+        profile.project_complexity = self._assess_complexity(experiences, scan)
         
         # Career progression
-        profile.career_progression = self._analyze_progression(resume_data)
+        profile.progression_roles = tuple(scan.roles)
+        profile.progression_companies = tuple(scan.companies)
+        profile.progression_durations = tuple(scan.durations)
+        profile.progression_levels = tuple(scan.levels)
         
         return profile
     
-    def _calculate_total_years(self, experiences) -> float:
-        """Calculate total years of experience"""
-        if not experiences:
-            return 0
-        
-        total_months = 0
+    def _scan_experiences(self, experiences, current_year: int) -> _ExperienceScan:
+        """Gather all per-experience aggregates in a single pass"""
+        scan = _ExperienceScan()
         
         for exp in experiences:
-            duration_months = self._parse_duration(exp.duration)
-            if duration_months:
-                total_months += duration_months
+            role = exp.role.lower()
+            company = exp.company.lower()
+            description = exp.description.lower()
+            
+            scan.total_months += self._parse_duration(exp.duration, current_year) or 0
+            
+            levels = _SENIORITY_MATCHER.find(role)
+            scan.has_senior = scan.has_senior or "senior" in levels
+            scan.has_junior = scan.has_junior or "junior" in levels
+            
+            # First experience with a role keyword decides the specialization
+            if scan.role_type is None:
+                scan.role_type = self._first_role(role + " " + company + " " + description)
+            
+            scan.company_types.extend(_COMPANY_MATCHER.find_ordered(company + " " + description))
+            
+            if not scan.has_leadership:
+                scan.has_leadership = _LEADERSHIP_MATCHER.matches(role + " " + description)
+            
+            scan.complexity_score += len(_COMPLEX_TECH_MATCHER.find(description))
+            
+            scan.roles.append(exp.role)
+            scan.companies.append(exp.company)
+            scan.durations.append(exp.duration)
+            scan.levels.append(self._assess_role_level(levels))
         
-        return round(total_months / 12, 1)
+        return scan
     
-    def _parse_duration(self, duration: str) -> Optional[int]:
+    def _parse_duration(self, duration: str, current_year: int) -> Optional[int]:
         """Parse duration string to months"""
         if not duration:
             return None
         
-        import re
-        
-        # Pattern for date ranges
-        date_pattern = (
-            r'(?i)(\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s*\d{2,4}|'
-            r'\d{1,2}/\d{2,4}|\d{4})\s*[-–—to]+\s*'
-            r'(\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s*\d{2,4}|'
-            r'\d{1,2}/\d{2,4}|\d{4}|present|current|now)'
-        )
-        
-        match = re.search(date_pattern, duration)
-        if match:
-            start_date = match.group(1)
-            end_date = match.group(2)
-            
-            start_year = self._extract_year(start_date)
-            end_year = self._extract_year(end_date)
-            
-            if start_year and end_year:
-                months = (end_year - start_year) * 12
-                return max(months, 0)
-        
-        # Try to find years directly
-        year_pattern = r'(\d+)\+?\s*(?:years?|yrs?)'
-        match = re.search(year_pattern, duration.lower())
-        if match:
-            return int(match.group(1)) * 12
-        
-        # Try to find months
-        month_pattern = r'(\d+)\s*(?:months?|mos?)'
-        match = re.search(month_pattern, duration.lower())
-        if match:
-            return int(match.group(1))
-        
-        # Look for year ranges like "2020 - 2023"
-        year_range = r'(\d{4})\s*[-–—]\s*(\d{4})'
-        match = re.search(year_range, duration)
-        if match:
-            start = int(match.group(1))
-            end = int(match.group(2))
-            if end >= start:
-                return (end - start) * 12
-        
-        return None
-    
-    def _extract_year(self, date_str: str) -> Optional[int]:
-        """Extract year from date string"""
-        import re
-        year_pattern = r'\b(19|20)\d{2}\b'
-        match = re.search(year_pattern, date_str)
-        if match:
-            return int(match.group())
-        
-        # Handle present/current
-        if any(word in date_str.lower() for word in ['present', 'current', 'now']):
-            return datetime.now().year
-        
-        return None
+        return _parse_duration_months(duration, current_year)
     
     def _determine_career_level(self, total_years: float) -> str:
         """Determine career level based on experience"""
-        if total_years < EXPERIENCE_THRESHOLDS["junior"]:
-            return "fresher"
-        elif total_years < EXPERIENCE_THRESHOLDS["mid"]:
-            return "junior"
-        elif total_years < EXPERIENCE_THRESHOLDS["senior"]:
-            return "mid-level"
-        elif total_years < EXPERIENCE_THRESHOLDS["lead"]:
-            return "senior"
-        elif total_years < EXPERIENCE_THRESHOLDS["architect"]:
-            return "lead"
-        else:
-            return "architect"
+        level = level_for_years(total_years)
+        return _CAREER_LEVEL_LABELS.get(level, level)
     
-    def _determine_level_from_roles(self, experiences) -> str:
+    def _determine_level_from_roles(self, experiences, scan: _ExperienceScan) -> str:
         """Determine career level from role titles"""
         if not experiences:
             return "fresher"
         
-        has_senior = False
-        has_junior = False
-        
-        for exp in experiences:
-            role_lower = exp.role.lower()
-            
-            for keyword in self.SENIOR_KEYWORDS:
-                if keyword in role_lower:
-                    has_senior = True
-            
-            for keyword in self.JUNIOR_KEYWORDS:
-                if keyword in role_lower:
-                    has_junior = True
-        
-        if has_senior and not has_junior:
+        if scan.has_senior and not scan.has_junior:
             return "senior"
-        elif has_junior and not has_senior:
+        elif scan.has_junior and not scan.has_senior:
             return "junior"
         
         return "mid"
     
-    def _identify_domains(self, resume_data) -> List[str]:
+    def _identify_domains(self, full_text_lower: str) -> List[str]:
         """Identify domains of expertise"""
-        domains = set()
-        text = self._get_full_text(resume_data).lower()
-        
-        for domain, keywords in self.DOMAIN_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text:
-                    domains.add(domain)
-                    break
-        
-        return list(domains)
+        return _DOMAIN_MATCHER.find_ordered(full_text_lower)
     
-    def _identify_role(self, resume_data) -> str:
+    def _identify_role(self, resume_data, scan: _ExperienceScan) -> str:
         """Identify primary role/specialization"""
-        text = self._get_full_text(resume_data).lower()
-        
         # Check experience titles
-        for exp in resume_data.experiences:
-            exp_text = (exp.role + " " + exp.company + " " + exp.description).lower()
-            
-            for role_type, keywords in self.ROLE_KEYWORDS.items():
-                for keyword in keywords:
-                    if keyword in exp_text:
-                        return role_type
+        if scan.role_type:
+            return scan.role_type
         
         # Check summary
         if resume_data.summary:
-            summary_text = resume_data.summary.lower()
-            for role_type, keywords in self.ROLE_KEYWORDS.items():
-                for keyword in keywords:
-                    if keyword in summary_text:
-                        return role_type
+            role_type = self._first_role(resume_data.summary.lower())
+            if role_type:
+                return role_type
         
         return "general"
     
-    def _identify_industries(self, resume_data) -> List[str]:
-        """Identify industries worked in"""
-        industries = set()
-        text = self._get_full_text(resume_data).lower()
-        
-        for industry, keywords in self.DOMAIN_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text:
-                    industries.add(industry)
-                    break
-        
-        return list(industries)
-    
-    def _identify_company_types(self, resume_data) -> List[str]:
-        """Identify types of companies worked at"""
-        company_types = set()
-        
-        for exp in resume_data.experiences:
-            company_text = (exp.company + " " + exp.description).lower()
-            
-            for company_type, keywords in self.COMPANY_KEYWORDS.items():
-                for keyword in keywords:
-                    if keyword in company_text:
-                        company_types.add(company_type)
-                        break
-        
-        return list(company_types)
-    
-    def _check_leadership(self, resume_data) -> bool:
-        """Check if candidate has leadership experience"""
-        for exp in resume_data.experiences:
-            exp_text = (exp.role + " " + exp.description).lower()
-            
-            for keyword in self.LEADERSHIP_KEYWORDS:
-                if keyword in exp_text:
-                    return True
-        
-        return False
+    def _first_role(self, text_lower: str) -> Optional[str]:
+        """Return the highest-priority role type found in text"""
+        found = _ROLE_MATCHER.find(text_lower)
+        if found:
+            return min(found, key=_ROLE_PRIORITY.__getitem__)
+        return None
     
-    def _assess_complexity(self, resume_data) -> str:
+    def _assess_complexity(self, experiences, scan: _ExperienceScan) -> str:
         """Assess complexity of projects worked on"""
-        total_experience = len(resume_data.experiences)
+        total_experience = len(experiences)
         
-        if not resume_data.experiences:
+        if not experiences:
             return "unknown"
         
-        # Check for complex technologies
-        complex_techs = ["microservices", "distributed", "scalable", "enterprise", 
-                         "high-traffic", "real-time", "machine learning", "ai"]
-        
-        complexity_score = 0
-        for exp in resume_data.experiences:
-            exp_text = exp.description.lower()
-            for tech in complex_techs:
-                if tech in exp_text:
-                    complexity_score += 1
+        # Complex technologies counted during the experience scan
+        complexity_score = scan.complexity_score
         
         # Also consider number of roles
         if total_experience >= 5:
@@ -350,32 +402,13 @@ class ExperienceAnalyzer:
         else:
             return "standard"
     
-    def _analyze_progression(self, resume_data) -> List[Dict]:
-        """Analyze career progression"""
-        progression = []
-        
-        for i, exp in enumerate(resume_data.experiences):
-            progression.append({
-                "role": exp.role,
-                "company": exp.company,
-                "duration": exp.duration,
-                "level": self._assess_role_level(exp.role),
-                "sequence": i + 1
-            })
-        
-        return progression
-    
-    def _assess_role_level(self, role: str) -> str:
-        """Assess level of a specific role"""
-        role_lower = role.lower()
-        
-        for keyword in self.SENIOR_KEYWORDS:
-            if keyword in role_lower:
-                return "senior"
+    def _assess_role_level(self, levels: Set[str]) -> str:
+        """Assess level of a role from the seniority keywords in its title"""
+        if "senior" in levels:
+            return "senior"
         
-        for keyword in self.JUNIOR_KEYWORDS:
-            if keyword in role_lower:
-                return "junior"
+        if "junior" in levels:
+            return "junior"
         
         return "mid"
     
@@ -397,6 +430,16 @@ class ExperienceAnalyzer:
         
         return " ".join(parts)
     
+    def _get_full_text_lower(self, resume_data) -> str:
+        """Get lowercased resume text, memoized on the resume data object"""
+        cached = getattr(resume_data, "_full_text_lower", None)
+        if cached is not None:
+            return cached
+        
+        text_lower = self._get_full_text(resume_data).lower()
+        object.__setattr__(resume_data, "_full_text_lower", text_lower)
+        return text_lower
+    
     def get_experience_summary(self, profile: ExperienceProfile) -> Dict:
         """Generate a summary of experience analysis"""
         return {
@@ -405,7 +448,7 @@ class ExperienceAnalyzer:
             "key_domains": ", ".join(profile.domain_expertise[:3]) if profile.domain_expertise else "Not specified",
             "leadership": "Yes" if profile.leadership_experience else "Developing",
             "complexity": profile.project_complexity.title(),
-            "progression": "Progressive" if len(profile.career_progression) > 1 else "Early career",
+            "progression": "Progressive" if len(profile.progression_roles) > 1 else "Early career",
             "recommendations": self._get_experience_recommendations(profile)
         }
     
@@ -429,3 +472,8 @@ class ExperienceAnalyzer:
             recommendations.append("Identify and focus on a specific industry domain")
         
         return recommendations
+
+
+def _analyze_experience_worker(resume_data) -> ExperienceProfile:
+    """Process pool entry point for ExperienceAnalyzer.analyze_batch"""
+    return ExperienceAnalyzer().analyze_experience(resume_data)
@@ -1,21 +1,27 @@
 """
 Job Recommender for Resume Intelligence Engine
 """
-from typing import Dict, List, Optional, Tuple
+import heapq
+import threading
+from itertools import islice
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
-from config.config import JOB_ROLES, SKILL_CATEGORIES
+from config.config import JOB_ROLES, SKILL_CATEGORIES, ROLE_REQUIRED_SETS
 from utils.skill_normalizer import SkillNormalizer
+from utils.compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class JobRecommendation:
-    """Job recommendation data structure"""
+    """Job recommendation data structure, immutable so cached results can be shared"""
     job_id: str
     title: str
     match_score: float
-    why_fits: List[str]
-    required_skills_vs_candidate: Dict
-    missing_critical_skills: List[str]
+    why_fits: Tuple[str, ...]
+    required_skills_vs_candidate: Mapping[str, Tuple[str, ...]]
+    missing_critical_skills: Tuple[str, ...]
     skill_match_percentage: float
     growth_potential: str
     demand_level: str
@@ -25,210 +31,520 @@ class JobRecommendation:
             "job_id": self.job_id,
             "title": self.title,
             "match_score": self.match_score,
-            "why_fits": self.why_fits,
-            "required_skills_vs_candidate": self.required_skills_vs_candidate,
-            "missing_critical_skills": self.missing_critical_skills,
+            "why_fits": list(self.why_fits),
+            "required_skills_vs_candidate": {
+                key: list(skills) for key, skills in self.required_skills_vs_candidate.items()
+            },
+            "missing_critical_skills": list(self.missing_critical_skills),
             "skill_match_percentage": self.skill_match_percentage,
             "growth_potential": self.growth_potential,
             "demand_level": self.demand_level
         }
 
 
+def _popcount(mask: int) -> int:
+    """Count set bits (int.bit_count needs Python 3.10+)"""
+    return bin(mask).count("1")
+
+
+def _combine_match_score(skill_match: float, critical_matched: int,
+                         critical_missing: int, critical_count: int,
+                         related_boost: float) -> float:
+    """Apply critical skill and related skill adjustments to a base match"""
+    # Adjust score based on critical skills
+    if critical_count:
+        critical_score = (critical_matched - critical_missing * 0.5) / critical_count
+        skill_match = min(1.0, skill_match + critical_score * 0.3)
+    
+    skill_match = min(1.0, skill_match + related_boost * 0.2)
+    
+    return round(skill_match, 2)
+
+
+def _match_jobs(candidate_mask: int, boosted_mask: int,
+                job_rows: List[Tuple[str, int, int, int, int, int]],
+                threshold: float = 0.2) -> Dict[str, float]:
+    """Score every job row against skill bitmasks, keeping those at the threshold
+    
+    Only ints and floats are touched here, so the loop has no attribute or
+    dictionary lookups per job.
+    """
+    scores = {}
+    for (job_id, required_mask, critical_mask,
+         required_count, critical_count, min_match) in job_rows:
+        matched_mask = required_mask & candidate_mask
+        matched_count = _popcount(matched_mask)
+        
+        # Skip hopeless jobs before the critical and related skill math
+        if matched_count < min_match and not critical_mask & matched_mask:
+            continue
+        
+        skill_match = matched_count / required_count if required_count else 0
+        related_boost = min(_popcount(required_mask & boosted_mask) * 0.1, 0.3)
+        
+        score = _combine_match_score(
+            skill_match,
+            _popcount(critical_mask & matched_mask),
+            _popcount(critical_mask & ~matched_mask),
+            critical_count,
+            related_boost
+        )
+        if score >= threshold:
+            scores[job_id] = score
+    
+    return scores
+
+
+# Job demand and growth data - including non-technical roles
+_JOB_MARKET_DATA = {
+    # Technical roles
+    "software_engineer": {"demand": "high", "growth": "stable", "avg_salary": "$100k-$150k"},
+    "data_scientist": {"demand": "very_high", "growth": "growing", "avg_salary": "$120k-$160k"},
+    "frontend_developer": {"demand": "high", "growth": "stable", "avg_salary": "$90k-$130k"},
+    "backend_developer": {"demand": "high", "growth": "stable", "avg_salary": "$100k-$140k"},
+    "full_stack_developer": {"demand": "very_high", "growth": "growing", "avg_salary": "$110k-$150k"},
+    "devops_engineer": {"demand": "high", "growth": "growing", "avg_salary": "$120k-$160k"},
+    "machine_learning_engineer": {"demand": "very_high", "growth": "growing", "avg_salary": "$140k-$180k"},
+    "product_manager": {"demand": "high", "growth": "stable", "avg_salary": "$120k-$170k"},
+    "data_analyst": {"demand": "high", "growth": "stable", "avg_salary": "$70k-$100k"},
+    "cloud_architect": {"demand": "high", "growth": "growing", "avg_salary": "$150k-$200k"},
+
+    # Non-technical roles
+    "project_manager": {"demand": "very_high", "growth": "stable", "avg_salary": "$90k-$140k"},
+    "teacher": {"demand": "medium", "growth": "stable", "avg_salary": "$45k-$75k"},
+    "sales_representative": {"demand": "high", "growth": "stable", "avg_salary": "$50k-$80k"},
+    "account_manager": {"demand": "high", "growth": "stable", "avg_salary": "$70k-$110k"},
+    "retail_associate": {"demand": "high", "growth": "stable", "avg_salary": "$25k-$40k"},
+    "customer_service_rep": {"demand": "high", "growth": "stable", "avg_salary": "$30k-$50k"},
+    "nurse": {"demand": "very_high", "growth": "growing", "avg_salary": "$70k-$120k"},
+    "administrative_assistant": {"demand": "medium", "growth": "stable", "avg_salary": "$35k-$55k"},
+    "accountant": {"demand": "high", "growth": "stable", "avg_salary": "$60k-$100k"},
+    "hr_specialist": {"demand": "high", "growth": "stable", "avg_salary": "$55k-$90k"},
+    "operations_manager": {"demand": "high", "growth": "stable", "avg_salary": "$80k-$130k"},
+    "marketing_specialist": {"demand": "high", "growth": "growing", "avg_salary": "$55k-$95k"},
+    "business_analyst": {"demand": "high", "growth": "stable", "avg_salary": "$75k-$115k"}
+}
+
+# (demand, growth) per job, with the fallback for jobs missing from _JOB_MARKET_DATA
+_MARKET_TUPLE = {
+    job_id: (market["demand"], market["growth"])
+    for job_id, market in _JOB_MARKET_DATA.items()
+}
+_DEFAULT_MARKET = ("medium", "stable")
+
+# Critical skills for each role
+_CRITICAL_SKILLS = {
+    # Technical roles
+    "software_engineer": ["Python", "Java", "SQL", "Git"],
+    "data_scientist": ["Python", "Machine Learning", "SQL", "Statistics"],
+    "frontend_developer": ["JavaScript", "HTML", "CSS", "React"],
+    "backend_developer": ["Python", "Java", "SQL", "REST API"],
+    "full_stack_developer": ["JavaScript", "Python", "React", "Node.js"],
+    "devops_engineer": ["Docker", "Kubernetes", "CI/CD", "AWS"],
+    "machine_learning_engineer": ["Python", "TensorFlow", "PyTorch", "Machine Learning"],
+    "product_manager": ["Communication", "Strategy", "Analytics"],
+    "data_analyst": ["Python", "SQL", "Excel", "Tableau"],
+    "cloud_architect": ["AWS", "Azure", "Docker", "Kubernetes"],
+
+    # Non-technical roles
+    "project_manager": ["Project Planning", "Risk Management", "Stakeholder Management", "Agile"],
+    "teacher": ["Curriculum Development", "Lesson Planning", "Classroom Management", "Teaching"],
+    "sales_representative": ["Sales", "Lead Generation", "Communication", "Negotiation"],
+    "account_manager": ["Account Management", "Client Relations", "Communication", "Negotiation"],
+    "retail_associate": ["Customer Service", "Retail", "Sales", "Point of Sale"],
+    "customer_service_rep": ["Customer Service", "Communication", "Problem Solving", "Interpersonal Skills"],
+    "nurse": ["Patient Care", "Clinical Skills", "Medical Terminology", "Healthcare Documentation"],
+    "administrative_assistant": ["Microsoft Office", "Data Entry", "Calendar Management", "Communication"],
+    "accountant": ["Financial Analysis", "Bookkeeping", "Excel", "Financial Reporting"],
+    "hr_specialist": ["Recruiting", "Employee Relations", "Training and Development", "Communication"],
+    "operations_manager": ["Operations Management", "Process Improvement", "Team Leadership", "Logistics"],
+    "marketing_specialist": ["Digital Marketing", "Social Media Marketing", "Content Marketing", "Analytics"],
+    "business_analyst": ["Analytical Skills", "Data Analysis", "Requirements Gathering", "Communication"]
+}
+
+# Related skills that earn a bonus toward a required skill
+_RELATED_SKILLS = {
+    "python": frozenset(["django", "flask", "fastapi", "pandas", "numpy"]),
+    "java": frozenset(["spring", "kotlin", "scala"]),
+    "javascript": frozenset(["typescript", "react", "vue", "node"]),
+    "sql": frozenset(["postgresql", "mysql", "mongodb"]),
+    "aws": frozenset(["azure", "gcp", "docker"]),
+    "machine learning": frozenset(["deep learning", "nlp", "tensorflow"]),
+    "react": frozenset(["redux", "next.js", "gatsby"]),
+    "docker": frozenset(["kubernetes", "terraform", "jenkins"]),
+}
+
+# Learning resources by skill, matched exactly or by partial name
+_LEARNING_PATHS = {
+    # Technical skills
+    "python": {
+        "resources": ["Official Python Tutorial", "Codecademy Python", "Real Python"],
+        "level": "Beginner",
+        "time_estimate": "2-4 weeks"
+    },
+    "javascript": {
+        "resources": ["MDN Web Docs", "JavaScript.info", "FreeCodeCamp"],
+        "level": "Intermediate",
+        "time_estimate": "4-6 weeks"
+    },
+    "react": {
+        "resources": ["Official React Docs", "React Tutorial", "Egghead.io"],
+        "level": "Intermediate",
+        "time_estimate": "3-4 weeks"
+    },
+    "machine learning": {
+        "resources": ["Coursera ML Course", "Fast.ai", "Andrew Ng's ML"],
+        "level": "Advanced",
+        "time_estimate": "3-6 months"
+    },
+    "docker": {
+        "resources": ["Docker Documentation", "Docker Mastery Course", "Katacoda"],
+        "level": "Intermediate",
+        "time_estimate": "2-3 weeks"
+    },
+    "kubernetes": {
+        "resources": ["Kubernetes.io", "Kube Academy", "CKA Prep"],
+        "level": "Advanced",
+        "time_estimate": "4-6 weeks"
+    },
+
+    # Non-technical / Soft skills
+    "project management": {
+        "resources": ["PMP Certification", "CAPM Prep", "Project Management Fundamentals"],
+        "level": "Intermediate",
+        "time_estimate": "2-3 months"
+    },
+    "communication": {
+        "resources": ["Dale Carnegie Course", "Toastmasters", "Business Communication Books"],
+        "level": "Beginner",
+        "time_estimate": "1-2 months"
+    },
+    "leadership": {
+        "resources": ["Leadership Books", "Executive Coaching", "Leadership Workshops"],
+        "level": "Advanced",
+        "time_estimate": "3-6 months"
+    },
+    "sales": {
+        "resources": ["Sales Training Programs", "Sandler Training", "SPIN Selling"],
+        "level": "Beginner",
+        "time_estimate": "1-2 months"
+    },
+    "customer service": {
+        "resources": ["Customer Service Training", "Zendesk Academy", "Help Desk Certification"],
+        "level": "Beginner",
+        "time_estimate": "2-4 weeks"
+    },
+    "negotiation": {
+        "resources": ["Never Split the Difference", "Harvard PON", "Negotiation Training"],
+        "level": "Intermediate",
+        "time_estimate": "1-2 months"
+    },
+    "teaching": {
+        "resources": ["Teaching Certification", "Coursera Teaching", "Classroom Management Training"],
+        "level": "Intermediate",
+        "time_estimate": "3-6 months"
+    },
+    "curriculum development": {
+        "resources": ["Instructional Design Courses", "ADDIE Model", "eLearning Industry"],
+        "level": "Intermediate",
+        "time_estimate": "2-3 months"
+    },
+    "data analysis": {
+        "resources": ["Excel Advanced", "Tableau Training", "Google Data Analytics Certificate"],
+        "level": "Beginner",
+        "time_estimate": "2-3 months"
+    },
+    "digital marketing": {
+        "resources": ["Google Digital Garage", "HubSpot Academy", "Facebook Blueprint"],
+        "level": "Beginner",
+        "time_estimate": "1-2 months"
+    },
+    "financial analysis": {
+        "resources": ["Financial Modeling Courses", "CFA Preparation", "Wall Street Prep"],
+        "level": "Intermediate",
+        "time_estimate": "3-6 months"
+    },
+    "recruiting": {
+        "resources": ["SHRM Certification", "LinkedIn Recruiter Training", "Recruiting Software Certifications"],
+        "level": "Beginner",
+        "time_estimate": "1-2 months"
+    },
+    "process improvement": {
+        "resources": ["Six Sigma Certification", "Lean Training", "Process Excellence"],
+        "level": "Intermediate",
+        "time_estimate": "2-3 months"
+    }
+}
+
+_DEFAULT_LEARNING_PATH = {
+    "resources": ["Online courses", "Industry-specific training", "Professional certifications"],
+    "level": "Intermediate",
+    "time_estimate": "2-3 months"
+}
+
+# Position of each experience level, unknown levels count as "mid"
+_LEVEL_INDEX = {
+    level: index
+    for index, level in enumerate(["fresher", "junior", "mid", "senior", "lead", "architect"])
+}
+
+# Upper bound in weeks of each time-to-ready estimate, shortest first
+_TIME_BUCKETS = ((2, "1-2 weeks"), (6, "1-2 months"), (12, "2-3 months"))
+
+
 class JobRecommender:
     """Recommend suitable job roles based on resume analysis"""
     
-    # Job demand and growth data - including non-technical roles
-    JOB_MARKET_DATA = {
-        # Technical roles
-        "software_engineer": {"demand": "high", "growth": "stable", "avg_salary": "$100k-$150k"},
-        "data_scientist": {"demand": "very_high", "growth": "growing", "avg_salary": "$120k-$160k"},
-        "frontend_developer": {"demand": "high", "growth": "stable", "avg_salary": "$90k-$130k"},
-        "backend_developer": {"demand": "high", "growth": "stable", "avg_salary": "$100k-$140k"},
-        "full_stack_developer": {"demand": "very_high", "growth": "growing", "avg_salary": "$110k-$150k"},
-        "devops_engineer": {"demand": "high", "growth": "growing", "avg_salary": "$120k-$160k"},
-        "machine_learning_engineer": {"demand": "very_high", "growth": "growing", "avg_salary": "$140k-$180k"},
-        "product_manager": {"demand": "high", "growth": "stable", "avg_salary": "$120k-$170k"},
-        "data_analyst": {"demand": "high", "growth": "stable", "avg_salary": "$70k-$100k"},
-        "cloud_architect": {"demand": "high", "growth": "growing", "avg_salary": "$150k-$200k"},
-        
-        # Non-technical roles
-        "project_manager": {"demand": "very_high", "growth": "stable", "avg_salary": "$90k-$140k"},
-        "teacher": {"demand": "medium", "growth": "stable", "avg_salary": "$45k-$75k"},
-        "sales_representative": {"demand": "high", "growth": "stable", "avg_salary": "$50k-$80k"},
-        "account_manager": {"demand": "high", "growth": "stable", "avg_salary": "$70k-$110k"},
-        "retail_associate": {"demand": "high", "growth": "stable", "avg_salary": "$25k-$40k"},
-        "customer_service_rep": {"demand": "high", "growth": "stable", "avg_salary": "$30k-$50k"},
-        "nurse": {"demand": "very_high", "growth": "growing", "avg_salary": "$70k-$120k"},
-        "administrative_assistant": {"demand": "medium", "growth": "stable", "avg_salary": "$35k-$55k"},
-        "accountant": {"demand": "high", "growth": "stable", "avg_salary": "$60k-$100k"},
-        "hr_specialist": {"demand": "high", "growth": "stable", "avg_salary": "$55k-$90k"},
-        "operations_manager": {"demand": "high", "growth": "stable", "avg_salary": "$80k-$130k"},
-        "marketing_specialist": {"demand": "high", "growth": "growing", "avg_salary": "$55k-$95k"},
-        "business_analyst": {"demand": "high", "growth": "stable", "avg_salary": "$75k-$115k"}
-    }
+    # Reference tables (module-level, kept here for callers that read them)
+    JOB_MARKET_DATA = _JOB_MARKET_DATA
+    CRITICAL_SKILLS = _CRITICAL_SKILLS
+    RELATED_SKILLS = _RELATED_SKILLS
+    LEARNING_PATHS = _LEARNING_PATHS
+    DEFAULT_LEARNING_PATH = _DEFAULT_LEARNING_PATH
     
-    # Critical skills for each role
-    CRITICAL_SKILLS = {
-        # Technical roles
-        "software_engineer": ["Python", "Java", "SQL", "Git"],
-        "data_scientist": ["Python", "Machine Learning", "SQL", "Statistics"],
-        "frontend_developer": ["JavaScript", "HTML", "CSS", "React"],
-        "backend_developer": ["Python", "Java", "SQL", "REST API"],
-        "full_stack_developer": ["JavaScript", "Python", "React", "Node.js"],
-        "devops_engineer": ["Docker", "Kubernetes", "CI/CD", "AWS"],
-        "machine_learning_engineer": ["Python", "TensorFlow", "PyTorch", "Machine Learning"],
-        "product_manager": ["Communication", "Strategy", "Analytics"],
-        "data_analyst": ["Python", "SQL", "Excel", "Tableau"],
-        "cloud_architect": ["AWS", "Azure", "Docker", "Kubernetes"],
-        
-        # Non-technical roles
-        "project_manager": ["Project Planning", "Risk Management", "Stakeholder Management", "Agile"],
-        "teacher": ["Curriculum Development", "Lesson Planning", "Classroom Management", "Teaching"],
-        "sales_representative": ["Sales", "Lead Generation", "Communication", "Negotiation"],
-        "account_manager": ["Account Management", "Client Relations", "Communication", "Negotiation"],
-        "retail_associate": ["Customer Service", "Retail", "Sales", "Point of Sale"],
-        "customer_service_rep": ["Customer Service", "Communication", "Problem Solving", "Interpersonal Skills"],
-        "nurse": ["Patient Care", "Clinical Skills", "Medical Terminology", "Healthcare Documentation"],
-        "administrative_assistant": ["Microsoft Office", "Data Entry", "Calendar Management", "Communication"],
-        "accountant": ["Financial Analysis", "Bookkeeping", "Excel", "Financial Reporting"],
-        "hr_specialist": ["Recruiting", "Employee Relations", "Training and Development", "Communication"],
-        "operations_manager": ["Operations Management", "Process Improvement", "Team Leadership", "Logistics"],
-        "marketing_specialist": ["Digital Marketing", "Social Media Marketing", "Content Marketing", "Analytics"],
-        "business_analyst": ["Analytical Skills", "Data Analysis", "Requirements Gathering", "Communication"]
-    }
+    # Lowercased skill lookups per job, built once at import by _build_lookup_tables
+    _TABLES_BUILT = False
+    _REQUIRED_LOWER: Dict[str, frozenset] = {}
+    _CRITICAL_LOWER: Dict[str, frozenset] = {}
+    _REQUIRED_LEN: Dict[str, int] = {}
+    _LEVEL_REASON: Dict[str, str] = {}
+    
+    # Bitmask view of the same tables: one bit per distinct required skill
+    _SKILL_BITS: Dict[str, int] = {}
+    # (job_id, required mask, critical mask, required count, critical count,
+    #  minimum matches that can reach the threshold) in JOB_ROLES order
+    _JOB_ROWS: List[Tuple[str, int, int, int, int, int]] = []
+    
+    # Resolved learning path for every required skill
+    _LEARNING_BY_SKILL: Dict[str, Dict] = {}
+    
+    # Related skill -> required skills it earns a bonus toward
+    _RELATED_INVERTED: Dict[str, frozenset] = {}
+    
+    # Maximum entries kept in each result cache
+    _CACHE_MAX = 128
     
     def __init__(self):
         self.normalizer = SkillNormalizer()
+        
+        # LRU cache of recommendations; the web app shares one instance across
+        # threads, and the immutable entries are handed out without copying
+        self._rec_cache: "OrderedDict[tuple, Tuple[JobRecommendation, ...]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    @classmethod
+    def _build_lookup_tables(cls):
+        """Precompute lowercased required and critical skill sets for every job"""
+        if cls._TABLES_BUILT:
+            return
+        
+        for job_id, job_data in JOB_ROLES.items():
+            cls._REQUIRED_LOWER[job_id] = ROLE_REQUIRED_SETS[job_id]
+            cls._REQUIRED_LEN[job_id] = len(job_data["required_skills"])
+            cls._LEVEL_REASON[job_id] = f"Experience level aligns with {job_data['experience_level']} role"
+            cls._CRITICAL_LOWER[job_id] = frozenset(
+                s.lower() for s in _CRITICAL_SKILLS.get(job_id, ())
+            )
+            
+            for skill in cls._REQUIRED_LOWER[job_id]:
+                cls._SKILL_BITS.setdefault(skill, 1 << len(cls._SKILL_BITS))
+        
+        for job_id, required in cls._REQUIRED_LOWER.items():
+            required_count = cls._REQUIRED_LEN[job_id]
+            cls._JOB_ROWS.append((
+                job_id,
+                cls._skill_mask(required),
+                # Critical skills only count when they are also required
+                cls._skill_mask(required & cls._CRITICAL_LOWER[job_id]),
+                required_count,
+                len(cls._CRITICAL_LOWER[job_id]),
+                # Without a critical match the score is at most matched/required plus
+                # the 0.06 related bonus, so fewer than 13% matched can't round up to 0.2
+                -(-13 * required_count // 100),
+            ))
+        
+        related_inverted = {}
+        for required_skill, related in _RELATED_SKILLS.items():
+            for skill in related:
+                related_inverted.setdefault(skill, set()).add(required_skill)
+        cls._RELATED_INVERTED.update(
+            (skill, frozenset(parents)) for skill, parents in related_inverted.items()
+        )
+        
+        # Missing skills always come from the required skills, so resolve them up front
+        for skill in cls._SKILL_BITS:
+            cls._LEARNING_BY_SKILL[skill] = cls._match_learning_path(skill)
+        
+        cls._TABLES_BUILT = True
+    
+    @classmethod
+    def _skill_mask(cls, skills_lower) -> int:
+        """Combine the bits of the known skills in a collection"""
+        bits = cls._SKILL_BITS
+        mask = 0
+        for skill in skills_lower:
+            mask |= bits.get(skill, 0)
+        return mask
     
     def recommend_jobs(self, skill_profile, experience_profile, 
                        top_n: int = 10) -> List[JobRecommendation]:
         """Recommend top job roles based on skills and experience"""
         recommendations = []
         
-        candidate_skills_lower = set(s.lower() for s in skill_profile.all_skills)
-        career_level = experience_profile.career_level
-        total_years = experience_profile.total_years
+        candidate_skills_lower = self._candidate_lower(skill_profile)
         
-        for job_id, job_data in JOB_ROLES.items():
+        # Everything the recommendations depend on: skills, the domain quoted
+        # in why_fits, and the requested count
+        domains = experience_profile.domain_expertise
+        cache_key = (candidate_skills_lower, domains[0] if domains else None, top_n)
+        cached = self._cache_get(self._rec_cache, cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        # The domain reason is the same for every job, so format it once
+        domain_reason = f"Has {domains[0].title()} domain experience" if domains else None
+        
+        # Score every job from bitmasks, then build full matches only for the top N.
+        # Lower threshold to 20% for more job recommendations
+        job_scores = self._score_jobs(candidate_skills_lower, threshold=0.2)
+        
+        # Select by match score; ties keep JOB_ROLES order like a stable sort
+        for job_id in heapq.nlargest(top_n, job_scores, key=job_scores.__getitem__):
+            job_data = JOB_ROLES[job_id]
+            
             # Calculate match
             match_result = self._calculate_job_match(
-                job_id, job_data, candidate_skills_lower, skill_profile
+                job_id, self._REQUIRED_LOWER[job_id], self._CRITICAL_LOWER[job_id],
+                candidate_skills_lower
             )
-            
-            # Lower threshold to 20% for more job recommendations
-            if match_result["skill_match_percentage"] >= 0.2:
-                recommendation = self._create_recommendation(
-                    job_id, job_data, match_result, experience_profile
-                )
-                recommendations.append(recommendation)
+            recommendation = self._create_recommendation(
+                job_id, job_data, match_result, domain_reason
+            )
+            recommendations.append(recommendation)
         
-        # Sort by match score
-        recommendations.sort(key=lambda x: x.match_score, reverse=True)
+        self._cache_put(self._rec_cache, cache_key, tuple(recommendations))
         
-        return recommendations[:top_n]
+        return recommendations
+    
+    def _candidate_lower(self, skill_profile) -> frozenset:
+        """Get the candidate's lowercased skills, memoized on the skill profile"""
+        return skill_profile.all_skills_lower
+    
+    def _cache_get(self, cache: OrderedDict, key: tuple):
+        """Return a cached value and mark it recently used, or None"""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+    
+    def _cache_put(self, cache: OrderedDict, key: tuple, value) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > self._CACHE_MAX:
+                cache.popitem(last=False)
     
     def _matches_experience_level(self, candidate_level: str, 
                                    required_level: str) -> bool:
         """Check if candidate experience matches job requirement"""
-        level_order = ["fresher", "junior", "mid", "senior", "lead", "architect"]
-        
-        candidate_index = level_order.index(candidate_level) if candidate_level in level_order else 2
-        required_index = level_order.index(required_level) if required_level in level_order else 2
+        candidate_index = _LEVEL_INDEX.get(candidate_level, 2)
+        required_index = _LEVEL_INDEX.get(required_level, 2)
         
         # Allow 1 level difference
         return abs(candidate_index - required_index) <= 1
     
-    def _calculate_job_match(self, job_id: str, job_data: Dict,
-                             candidate_skills_lower: set,
-                             skill_profile) -> Dict:
-        """Calculate how well candidate matches a job"""
-        required_skills = [s.lower() for s in job_data["required_skills"]]
-        critical_skills = [s.lower() for s in self.CRITICAL_SKILLS.get(job_id, [])]
-        
-        matched = candidate_skills_lower & set(required_skills)
-        missing = set(required_skills) - candidate_skills_lower
+    def _calculate_job_match(self, job_id: str, required_skills: frozenset,
+                             critical_skills: frozenset,
+                             candidate_skills_lower: frozenset) -> Dict:
+        """Calculate how well candidate matches a job from lowercased skill sets"""
+        matched = candidate_skills_lower & required_skills
+        missing = required_skills - candidate_skills_lower
         
         # Calculate match percentage
-        skill_match = len(matched) / len(required_skills) if required_skills else 0
+        required_count = self._REQUIRED_LEN[job_id]
+        skill_match = len(matched) / required_count if required_count else 0
         
         # Critical skill bonus/penalty
-        critical_matched = len(set(critical_skills) & matched)
-        critical_missing = len(set(critical_skills) & missing)
-        
-        # Adjust score based on critical skills
-        if critical_skills:
-            critical_score = (critical_matched - critical_missing * 0.5) / len(critical_skills)
-            skill_match = min(1.0, skill_match + critical_score * 0.3)
+        critical_matched = len(critical_skills & matched)
+        critical_missing = len(critical_skills & missing)
         
         # Boost for related skills
         related_boost = self._calculate_related_skill_boost(
             matched, required_skills, candidate_skills_lower
         )
-        skill_match = min(1.0, skill_match + related_boost * 0.2)
+        
+        skill_match = _combine_match_score(
+            skill_match, critical_matched, critical_missing,
+            len(critical_skills), related_boost
+        )
         
         return {
-            "skill_match_percentage": round(skill_match, 2),
-            "matched_skills": list(matched),
-            "missing_skills": list(missing),
+            "skill_match_percentage": skill_match,
+            "matched_skills": matched,
+            "missing_skills": missing,
             "critical_matched": critical_matched,
             "critical_missing": critical_missing,
             "related_skills_found": related_boost > 0
         }
     
-    def _calculate_related_skill_boost(self, matched: set, required: set,
-                                       candidate_skills: set) -> float:
-        """Calculate bonus for having related skills"""
-        related_mapping = {
-            "python": ["django", "flask", "fastapi", "pandas", "numpy"],
-            "java": ["spring", "kotlin", "scala"],
-            "javascript": ["typescript", "react", "vue", "node"],
-            "sql": ["postgresql", "mysql", "mongodb"],
-            "aws": ["azure", "gcp", "docker"],
-            "machine learning": ["deep learning", "nlp", "tensorflow"],
-            "react": ["redux", "next.js", "gatsby"],
-            "docker": ["kubernetes", "terraform", "jenkins"],
-        }
+    def _score_jobs(self, candidate_skills_lower: frozenset,
+                    threshold: float = 0.2) -> Dict[str, float]:
+        """Compute the match score of every job that reaches the threshold"""
+        candidate_mask = self._skill_mask(candidate_skills_lower)
+        
+        # Required skills whose related skills the candidate has
+        boosted_mask = self._skill_mask(self._boosted_skills(candidate_skills_lower))
         
-        boost = 0
-        for req_skill in required:
-            req_lower = req_skill.lower()
-            if req_lower in related_mapping:
-                related = set(related_mapping[req_lower])
-                if related & candidate_skills:
-                    boost += 0.1
+        return _match_jobs(candidate_mask, boosted_mask, self._JOB_ROWS, threshold)
+    
+    def _calculate_related_skill_boost(self, matched: set, required: frozenset,
+                                       candidate_skills: frozenset) -> float:
+        """Calculate bonus for having related skills (required is already lowercased)"""
+        hits = len(self._boosted_skills(candidate_skills) & required)
         
-        return min(boost, 0.3)  # Cap boost
+        return min(hits * 0.1, 0.3)  # Cap boost
     
-    def _create_recommendation(self, job_id: str, job_data: Dict,
-                               match_result: Dict, experience_profile) -> JobRecommendation:
+    def _boosted_skills(self, candidate_skills: frozenset) -> set:
+        """Required skills that the candidate has at least one related skill for"""
+        boosted = set()
+        for skill in candidate_skills:
+            parents = self._RELATED_INVERTED.get(skill)
+            if parents is not None:
+                boosted |= parents
+        return boosted
+    
+    def _create_recommendation(self, job_id: str, job_data: Dict, match_result: Dict,
+                               domain_reason: Optional[str]) -> JobRecommendation:
         """Create a job recommendation object"""
-        market_data = self.JOB_MARKET_DATA.get(job_id, {"demand": "medium", "growth": "stable"})
+        demand, growth = _MARKET_TUPLE.get(job_id, _DEFAULT_MARKET)
         
         # Generate why it fits
-        why_fits = self._generate_why_fits(job_data, match_result, experience_profile)
+        why_fits = self._generate_why_fits(job_id, match_result, domain_reason)
         
         # Identify missing critical skills
-        critical_skills = [s for s in match_result["missing_skills"] 
-                          if s.lower() in [c.lower() for c in self.CRITICAL_SKILLS.get(job_id, [])]]
+        critical_lower = self._CRITICAL_LOWER[job_id]
+        critical_skills = [s for s in match_result["missing_skills"] if s in critical_lower]
         
         return JobRecommendation(
             job_id=job_id,
             title=job_data["title"],
             match_score=match_result["skill_match_percentage"],
-            why_fits=why_fits,
-            required_skills_vs_candidate={
-                "required": job_data["required_skills"],
-                "matched": match_result["matched_skills"],
-                "missing": list(match_result["missing_skills"])
-            },
-            missing_critical_skills=critical_skills,
+            why_fits=tuple(why_fits),
+            required_skills_vs_candidate=MappingProxyType({
+                "required": tuple(job_data["required_skills"]),
+                "matched": tuple(match_result["matched_skills"]),
+                "missing": tuple(match_result["missing_skills"])
+            }),
+            missing_critical_skills=tuple(critical_skills),
             skill_match_percentage=match_result["skill_match_percentage"] * 100,
-            growth_potential=market_data["growth"],
-            demand_level=market_data["demand"]
+            growth_potential=growth,
+            demand_level=demand
         )
     
-    def _generate_why_fits(self, job_data: Dict, match_result: Dict,
-                          experience_profile) -> List[str]:
+    def _generate_why_fits(self, job_id: str, match_result: Dict,
+                          domain_reason: Optional[str]) -> List[str]:
         """Generate reasons why the job fits the candidate"""
         reasons = []
         
@@ -237,17 +553,16 @@ class JobRecommender:
         reasons.append(f"Matches {match_pct:.0f}% of required skills")
         
         # Domain expertise
-        if experience_profile.domain_expertise:
-            domain_reason = f"Has {experience_profile.domain_expertise[0].title()} domain experience"
+        if domain_reason:
             reasons.append(domain_reason)
         
         # Career level match
-        reasons.append(f"Experience level aligns with {job_data['experience_level']} role")
+        reasons.append(self._LEVEL_REASON[job_id])
         
         # Specific skill matches
         matched = match_result["matched_skills"]
         if len(matched) >= 2:
-            reasons.append(f"Key skills: {', '.join(matched[:3])}")
+            reasons.append(f"Key skills: {', '.join(islice(matched, 3))}")
         
         return reasons[:4]  # Limit to top 4 reasons
     
@@ -257,150 +572,67 @@ class JobRecommender:
             return {"error": f"Unknown job: {target_job_id}"}
         
         job_data = JOB_ROLES[target_job_id]
-        required_skills = [s.lower() for s in job_data["required_skills"]]
-        candidate_skills_lower = set(s.lower() for s in skill_profile.all_skills)
-        
-        matched = candidate_skills_lower & set(required_skills)
-        missing = set(required_skills) - candidate_skills_lower
+        candidate_skills_lower = self._candidate_lower(skill_profile)
         
-        # Categorize missing skills
-        critical_missing = [s for s in missing 
-                           if s.lower() in [c.lower() for c in self.CRITICAL_SKILLS.get(target_job_id, [])]]
-        important_missing = [s for s in missing if s not in critical_missing]
+        matched, missing, critical_missing, important_missing = self._gap_core(
+            candidate_skills_lower, target_job_id
+        )
         
         # Get learning resources for missing skills
         learning_resources = {}
         for skill in missing:
             learning_resources[skill.title()] = self._suggest_learning_path(skill)
         
-        return {
+        gap_analysis = {
             "target_role": job_data["title"],
-            "match_percentage": round(len(matched) / len(required_skills), 2) * 100,
+            "match_percentage": round(len(matched) / self._REQUIRED_LEN[target_job_id], 2) * 100,
             "matched_skills": list(matched),
             "critical_missing_skills": critical_missing,
             "important_missing_skills": important_missing,
             "learning_resources": learning_resources,
             "time_to_job_ready": self._estimate_time_to_ready(missing, critical_missing)
         }
+        
+        return gap_analysis
+    
+    def _gap_core(self, candidate_skills_lower: frozenset,
+                  target_job_id: str) -> Tuple[set, set, List[str], List[str]]:
+        """Split a job's required skills into matched, missing, critical and other missing"""
+        required_skills = self._REQUIRED_LOWER[target_job_id]
+        critical_lower = self._CRITICAL_LOWER[target_job_id]
+        
+        matched = candidate_skills_lower & required_skills
+        missing = required_skills - candidate_skills_lower
+        
+        # Categorize missing skills
+        critical_missing = [s for s in missing if s in critical_lower]
+        important_missing = [s for s in missing if s not in critical_lower]
+        
+        return matched, missing, critical_missing, important_missing
     
     def _suggest_learning_path(self, skill: str) -> Dict:
         """Suggest learning path for a skill"""
         skill_lower = skill.lower()
         
-        learning_paths = {
-            # Technical skills
-            "python": {
-                "resources": ["Official Python Tutorial", "Codecademy Python", "Real Python"],
-                "level": "Beginner",
-                "time_estimate": "2-4 weeks"
-            },
-            "javascript": {
-                "resources": ["MDN Web Docs", "JavaScript.info", "FreeCodeCamp"],
-                "level": "Intermediate",
-                "time_estimate": "4-6 weeks"
-            },
-            "react": {
-                "resources": ["Official React Docs", "React Tutorial", "Egghead.io"],
-                "level": "Intermediate",
-                "time_estimate": "3-4 weeks"
-            },
-            "machine learning": {
-                "resources": ["Coursera ML Course", "Fast.ai", "Andrew Ng's ML"],
-                "level": "Advanced",
-                "time_estimate": "3-6 months"
-            },
-            "docker": {
-                "resources": ["Docker Documentation", "Docker Mastery Course", "Katacoda"],
-                "level": "Intermediate",
-                "time_estimate": "2-3 weeks"
-            },
-            "kubernetes": {
-                "resources": ["Kubernetes.io", "Kube Academy", "CKA Prep"],
-                "level": "Advanced",
-                "time_estimate": "4-6 weeks"
-            },
-            
-            # Non-technical / Soft skills
-            "project management": {
-                "resources": ["PMP Certification", "CAPM Prep", "Project Management Fundamentals"],
-                "level": "Intermediate",
-                "time_estimate": "2-3 months"
-            },
-            "communication": {
-                "resources": ["Dale Carnegie Course", "Toastmasters", "Business Communication Books"],
-                "level": "Beginner",
-                "time_estimate": "1-2 months"
-            },
-            "leadership": {
-                "resources": ["Leadership Books", "Executive Coaching", "Leadership Workshops"],
-                "level": "Advanced",
-                "time_estimate": "3-6 months"
-            },
-            "sales": {
-                "resources": ["Sales Training Programs", "Sandler Training", "SPIN Selling"],
-                "level": "Beginner",
-                "time_estimate": "1-2 months"
-            },
-            "customer service": {
-                "resources": ["Customer Service Training", "Zendesk Academy", "Help Desk Certification"],
-                "level": "Beginner",
-                "time_estimate": "2-4 weeks"
-            },
-            "negotiation": {
-                "resources": ["Never Split the Difference", "Harvard PON", "Negotiation Training"],
-                "level": "Intermediate",
-                "time_estimate": "1-2 months"
-            },
-            "teaching": {
-                "resources": ["Teaching Certification", "Coursera Teaching", "Classroom Management Training"],
-                "level": "Intermediate",
-                "time_estimate": "3-6 months"
-            },
-            "curriculum development": {
-                "resources": ["Instructional Design Courses", "ADDIE Model", "eLearning Industry"],
-                "level": "Intermediate",
-                "time_estimate": "2-3 months"
-            },
-            "data analysis": {
-                "resources": ["Excel Advanced", "Tableau Training", "Google Data Analytics Certificate"],
-                "level": "Beginner",
-                "time_estimate": "2-3 months"
-            },
-            "digital marketing": {
-                "resources": ["Google Digital Garage", "HubSpot Academy", "Facebook Blueprint"],
-                "level": "Beginner",
-                "time_estimate": "1-2 months"
-            },
-            "financial analysis": {
-                "resources": ["Financial Modeling Courses", "CFA Preparation", "Wall Street Prep"],
-                "level": "Intermediate",
-                "time_estimate": "3-6 months"
-            },
-            "recruiting": {
-                "resources": ["SHRM Certification", "LinkedIn Recruiter Training", "Recruiting Software Certifications"],
-                "level": "Beginner",
-                "time_estimate": "1-2 months"
-            },
-            "process improvement": {
-                "resources": ["Six Sigma Certification", "Lean Training", "Process Excellence"],
-                "level": "Intermediate",
-                "time_estimate": "2-3 months"
-            }
-        }
+        path = self._LEARNING_BY_SKILL.get(skill_lower)
+        if path is None:
+            path = self._match_learning_path(skill_lower)
         
+        # The paths are shared tables, so hand out a copy the caller may edit
+        return dict(path, resources=list(path["resources"]))
+    
+    @classmethod
+    def _match_learning_path(cls, skill_lower: str) -> Dict:
+        """Find the learning path for a lowercased skill"""
         # Try exact match first, then partial
-        if skill_lower in learning_paths:
-            return learning_paths[skill_lower]
+        if skill_lower in _LEARNING_PATHS:
+            return _LEARNING_PATHS[skill_lower]
         
-        for key, path in learning_paths.items():
+        for key, path in _LEARNING_PATHS.items():
             if key in skill_lower or skill_lower in key:
                 return path
         
-        return {
-            "resources": ["Online courses", "Industry-specific training", "Professional certifications"],
-            "level": "Intermediate",
-            "time_estimate": "2-3 months"
-        }
+        return _DEFAULT_LEARNING_PATH
     
     def _estimate_time_to_ready(self, missing_skills: List[str],
                                 critical_missing: List[str]) -> str:
@@ -408,21 +640,13 @@ class JobRecommender:
         if not missing_skills:
             return "Ready now"
         
-        # Base estimate on critical missing skills
-        weeks_per_critical = 3
-        weeks_per_other = 2
-        
-        total_weeks = len(critical_missing) * weeks_per_critical + \
-                     (len(missing_skills) - len(critical_missing)) * weeks_per_other
-        
-        if total_weeks <= 2:
-            return "1-2 weeks"
-        elif total_weeks <= 6:
-            return "1-2 months"
-        elif total_weeks <= 12:
-            return "2-3 months"
-        else:
-            return "3+ months"
+        # Base estimate on critical missing skills: 3 weeks each, 2 for the rest
+        total_weeks = 3 * len(critical_missing) + 2 * (len(missing_skills) - len(critical_missing))
+        
+        return next(
+            (label for limit, label in _TIME_BUCKETS if total_weeks <= limit),
+            "3+ months"
+        )
     
     def get_career_roadmap(self, skill_profile, experience_profile,
                            target_job_id: str) -> Dict:
@@ -431,7 +655,10 @@ class JobRecommender:
             return {"error": "Unknown job target"}
         
         job_data = JOB_ROLES[target_job_id]
-        gap_analysis = self.get_skill_gap_analysis(skill_profile, target_job_id)
+        
+        # Only the critical gaps are needed, so skip learning paths and time estimates
+        candidate_skills_lower = self._candidate_lower(skill_profile)
+        _, _, critical_missing, _ = self._gap_core(candidate_skills_lower, target_job_id)
         
         roadmap = {
             "current_level": experience_profile.career_level,
@@ -441,10 +668,10 @@ class JobRecommender:
         }
         
         # Step 1: Learn critical missing skills
-        if gap_analysis.get("critical_missing_skills"):
+        if critical_missing:
             roadmap["steps"].append({
                 "phase": "Immediate Priority",
-                "actions": [f"Master {skill}" for skill in gap_analysis["critical_missing_skills"][:2]],
+                "actions": [f"Master {skill}" for skill in critical_missing[:2]],
                 "timeline": "1-2 months",
                 "outcome": "Core skill gaps filled"
             })
@@ -474,3 +701,7 @@ class JobRecommender:
         })
         
         return roadmap
+
+
+# Build the shared lookup tables at import, so threads never see them half-built
+JobRecommender._build_lookup_tables()
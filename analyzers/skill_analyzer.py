@@ -1,13 +1,77 @@
 """
 Skill Analyzer for Resume Intelligence Engine
 """
+import sys
+from itertools import chain
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
-from config.config import SKILL_CATEGORIES, JOB_ROLES
+from config.config import SKILL_CATEGORIES, SKILL_TO_CATEGORY, JOB_ROLES, ROLE_REQUIRED_SETS
 from utils.skill_normalizer import SkillNormalizer, NormalizedSkill
+from utils.keyword_matcher import KeywordMatcher
+from utils.compat import DATACLASS_SLOTS
 
+# Every category skill in SKILL_CATEGORIES order, matched by position so that
+# skills listed under several categories are reported once per category.
+# Whole words only, so "r" is not found inside "react"
+_CATEGORY_SKILLS = tuple(
+    skill
+    for category_skills in SKILL_CATEGORIES.values()
+    for skill in category_skills
+)
+_CATEGORY_SKILL_MATCHER = KeywordMatcher(
+    ((skill.lower(), index) for index, skill in enumerate(_CATEGORY_SKILLS)),
+    whole_words=True
+)
 
-@dataclass
+# Categories that make up SkillProfile.technical_skills, in output order
+_TECHNICAL_CATEGORIES = ("programming_languages", "frameworks_libraries", "data_science", "devops_cloud")
+
+# Skills reported as critical in a skill gap
+_GAP_CRITICAL_SKILLS = frozenset(("python", "java", "sql"))
+
+# In-demand skills to suggest for each primary category
+_HOT_SKILLS_DB = {
+    "programming_languages": ("Python", "TypeScript", "Go", "Rust"),
+    "frameworks_libraries": ("React", "Next.js", "FastAPI", "TensorFlow"),
+    "tools_platforms": ("Docker", "Kubernetes", "AWS", "PostgreSQL"),
+    "data_science": ("Machine Learning", "Deep Learning", "NLP"),
+    "devops_cloud": ("DevOps", "Cloud Architecture", "Terraform"),
+}
+
+# Skills that pair well with a primary skill
+_COMPLEMENTARY_DB = {
+    "Python": ("Django", "Flask", "FastAPI", "Pandas", "TensorFlow"),
+    "JavaScript": ("React", "Node.js", "TypeScript", "GraphQL"),
+    "Java": ("Spring", "Hibernate", "Maven", "Kubernetes"),
+    "React": ("Redux", "TypeScript", "Next.js", "Jest"),
+    "Machine Learning": ("TensorFlow", "PyTorch", "Scikit-learn", "MLOps"),
+}
+
+# Certifications for a primary skill
+_CERT_DB = {
+    "AWS": ("AWS Solutions Architect", "AWS Developer", "AWS DevOps Engineer"),
+    "Azure": ("Azure Solutions Architect", "Azure Developer", "Azure Administrator"),
+    "GCP": ("Google Cloud Professional", "GCP Architect", "GCP Data Engineer"),
+    "Kubernetes": ("CKA (Certified Kubernetes Administrator)", "CKAD (Developer)"),
+    "Python": ("PCEP", "PCAP", "PCPP"),
+    "Machine Learning": ("TensorFlow Developer", "AWS Machine Learning", "Google ML"),
+    "DevOps": ("DevOps Foundation", "Site Reliability Engineer"),
+    "Project Management": ("PMP", "CSM (Scrum Master)", "PRINCE2"),
+}
+
+# (skill, lowercased skill) pairs so suggestions are checked without lowercasing per call
+_HOT_SKILLS_LOWER = {
+    category: tuple((skill, skill.lower()) for skill in skills)
+    for category, skills in _HOT_SKILLS_DB.items()
+}
+_COMPLEMENTARY_LOWER = {
+    primary: tuple((skill, skill.lower()) for skill in skills)
+    for primary, skills in _COMPLEMENTARY_DB.items()
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SkillProfile:
     """Complete skill profile for a candidate"""
     all_skills: List[str] = field(default_factory=list)
@@ -20,22 +84,38 @@ class SkillProfile:
     technical_skills: List[str] = field(default_factory=list)
     tools_platforms: List[str] = field(default_factory=list)
     
+    # Memo for all_skills_lower (a declared field, since the class may use slots)
+    _skills_lower: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def all_skills_lower(self) -> frozenset:
+        """Lowercased all_skills, computed once on first access"""
+        cached = self._skills_lower
+        if cached is None:
+            cached = frozenset(sys.intern(s.lower()) for s in self.all_skills)
+            self._skills_lower = cached
+        return cached
+    
     def to_dict(self) -> Dict:
+        # Lists are copied so edits to the dict never reach the profile
         return {
-            "all_skills": self.all_skills,
-            "categorized_skills": self.categorized_skills,
+            "all_skills": list(self.all_skills),
+            "categorized_skills": {
+                category: list(skills)
+                for category, skills in self.categorized_skills.items()
+            },
             "primary_skills": [
-                {"skill": s[0], "category": s[1], "score": s[2]} 
-                for s in self.primary_skills
+                {"skill": skill, "category": category, "score": score}
+                for skill, category, score in self.primary_skills
             ],
             "secondary_skills": [
-                {"skill": s[0], "category": s[1], "score": s[2]} 
-                for s in self.secondary_skills
+                {"skill": skill, "category": category, "score": score}
+                for skill, category, score in self.secondary_skills
             ],
-            "emerging_skills": self.emerging_skills,
-            "soft_skills": self.soft_skills,
-            "technical_skills": self.technical_skills,
-            "tools_platforms": self.tools_platforms,
+            "emerging_skills": list(self.emerging_skills),
+            "soft_skills": list(self.soft_skills),
+            "technical_skills": list(self.technical_skills),
+            "tools_platforms": list(self.tools_platforms),
             "total_skills_count": len(self.all_skills)
         }
 
@@ -72,18 +152,16 @@ class SkillAnalyzer:
         
         # Normalize all skills
         profile.normalized_skills = self.normalizer.normalize_list(all_skills)
-        profile.all_skills = list(set([s.normalized for s in profile.normalized_skills]))
+        profile.all_skills = list(dict.fromkeys(s.normalized for s in profile.normalized_skills))
         
         # Categorize skills
         profile.categorized_skills = self.normalizer.categorize(profile.all_skills)
         
         # Separate by type
-        profile.technical_skills = (
-            profile.categorized_skills.get("programming_languages", []) +
-            profile.categorized_skills.get("frameworks_libraries", []) +
-            profile.categorized_skills.get("data_science", []) +
-            profile.categorized_skills.get("devops_cloud", [])
-        )
+        profile.technical_skills = list(chain.from_iterable(
+            profile.categorized_skills.get(category, ())
+            for category in _TECHNICAL_CATEGORIES
+        ))
         
         profile.soft_skills = profile.categorized_skills.get("soft_skills", [])
         profile.tools_platforms = profile.categorized_skills.get("tools_platforms", [])
@@ -106,15 +184,13 @@ class SkillAnalyzer:
     
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract potential skills from text"""
-        found_skills = []
-        text_lower = text.lower()
+        # Descriptions are often empty; skip lowercasing and scanning them
+        if not text:
+            return []
         
-        for category, category_skills in SKILL_CATEGORIES.items():
-            for skill in category_skills:
-                if skill.lower() in text_lower:
-                    found_skills.append(skill)
+        found = _CATEGORY_SKILL_MATCHER.find(text.lower())
         
-        return found_skills
+        return [_CATEGORY_SKILLS[index] for index in sorted(found)]
     
     def calculate_skill_gap(self, profile: SkillProfile, 
                             target_role: str) -> Dict:
@@ -125,8 +201,8 @@ class SkillAnalyzer:
         role_data = JOB_ROLES[target_role]
         required_skills = role_data["required_skills"]
         
-        candidate_skills = set(s.lower() for s in profile.all_skills)
-        required_skills_lower = set(s.lower() for s in required_skills)
+        candidate_skills = profile.all_skills_lower
+        required_skills_lower = ROLE_REQUIRED_SETS[target_role]
         
         matched = candidate_skills & required_skills_lower
         missing = required_skills_lower - candidate_skills
@@ -134,24 +210,27 @@ class SkillAnalyzer:
         match_percentage = len(matched) / len(required_skills_lower) if required_skills_lower else 1.0
         
         # Suggest alternatives for missing skills
+        # Missing skills often share a category, so expand each category once
         suggestions = {}
+        related_by_category = {}
         for missing_skill in missing:
-            category = self.normalizer._get_category(missing_skill.title())
+            category = SKILL_TO_CATEGORY.get(missing_skill, "unknown")
             if category != "unknown":
-                related = self.normalizer.suggest_skill_expansion(
-                    profile.all_skills, 
-                    category
-                )
-                suggestions[missing_skill.title()] = related[:3]
+                if category not in related_by_category:
+                    related_by_category[category] = self.normalizer.suggest_skill_expansion(
+                        profile.all_skills, 
+                        category
+                    )[:3]
+                suggestions[missing_skill.title()] = list(related_by_category[category])
         
         return {
             "target_role": role_data["title"],
-            "required_skills": required_skills,
+            "required_skills": list(required_skills),
             "matched_skills": list(matched),
             "missing_skills": list(missing),
             "match_percentage": round(match_percentage, 2),
             "skill_gap_analysis": {
-                "critical_missing": [s for s in missing if s in ["python", "java", "sql"]],
+                "critical_missing": [s for s in missing if s in _GAP_CRITICAL_SKILLS],
                 "recommended_learning": list(missing)
             },
             "suggestions": suggestions
@@ -168,61 +247,30 @@ class SkillAnalyzer:
         
         # Get primary skill categories
         primary_categories = [s[1] for s in profile.primary_skills[:3]]
+        current_lower = profile.all_skills_lower
         
         # Suggest hot skills based on market demand
-        hot_skills_db = {
-            "programming_languages": ["Python", "TypeScript", "Go", "Rust"],
-            "frameworks_libraries": ["React", "Next.js", "FastAPI", "TensorFlow"],
-            "tools_platforms": ["Docker", "Kubernetes", "AWS", "PostgreSQL"],
-            "data_science": ["Machine Learning", "Deep Learning", "NLP"],
-            "devops_cloud": ["DevOps", "Cloud Architecture", "Terraform"],
-        }
-        
         for category in primary_categories:
-            if category in hot_skills_db:
-                current_lower = [s.lower() for s in profile.all_skills]
-                for hot_skill in hot_skills_db[category]:
-                    if hot_skill.lower() not in current_lower:
-                        recommendations["hot_skills_to_learn"].append(hot_skill)
+            for hot_skill, hot_lower in _HOT_SKILLS_LOWER.get(category, ()):
+                if hot_lower not in current_lower:
+                    recommendations["hot_skills_to_learn"].append(hot_skill)
         
         # Suggest complementary skills
-        complementary_db = {
-            "Python": ["Django", "Flask", "FastAPI", "Pandas", "TensorFlow"],
-            "JavaScript": ["React", "Node.js", "TypeScript", "GraphQL"],
-            "Java": ["Spring", "Hibernate", "Maven", "Kubernetes"],
-            "React": ["Redux", "TypeScript", "Next.js", "Jest"],
-            "Machine Learning": ["TensorFlow", "PyTorch", "Scikit-learn", "MLOps"],
-        }
-        
         for skill in profile.primary_skills[:5]:
-            skill_name = skill[0]
-            if skill_name in complementary_db:
-                current_lower = [s.lower() for s in profile.all_skills]
-                for comp_skill in complementary_db[skill_name]:
-                    if comp_skill.lower() not in current_lower:
-                        recommendations["complementary_skills"].append(comp_skill)
+            for comp_skill, comp_lower in _COMPLEMENTARY_LOWER.get(skill[0], ()):
+                if comp_lower not in current_lower:
+                    recommendations["complementary_skills"].append(comp_skill)
         
         # Remove duplicates
-        recommendations["hot_skills_to_learn"] = list(set(recommendations["hot_skills_to_learn"]))[:5]
-        recommendations["complementary_skills"] = list(set(recommendations["complementary_skills"]))[:5]
+        recommendations["hot_skills_to_learn"] = list(dict.fromkeys(recommendations["hot_skills_to_learn"]))[:5]
+        recommendations["complementary_skills"] = list(dict.fromkeys(recommendations["complementary_skills"]))[:5]
         
         # Certification suggestions
-        cert_db = {
-            "AWS": ["AWS Solutions Architect", "AWS Developer", "AWS DevOps Engineer"],
-            "Azure": ["Azure Solutions Architect", "Azure Developer", "Azure Administrator"],
-            "GCP": ["Google Cloud Professional", "GCP Architect", "GCP Data Engineer"],
-            "Kubernetes": ["CKA (Certified Kubernetes Administrator)", "CKAD (Developer)"],
-            "Python": ["PCEP", "PCAP", "PCPP"],
-            "Machine Learning": ["TensorFlow Developer", "AWS Machine Learning", "Google ML"],
-            "DevOps": ["DevOps Foundation", "Site Reliability Engineer"],
-            "Project Management": ["PMP", "CSM (Scrum Master)", "PRINCE2"],
-        }
-        
-        cert_skills = [s[0] for s in profile.primary_skills if s[0] in cert_db]
+        cert_skills = [s[0] for s in profile.primary_skills if s[0] in _CERT_DB]
         for skill in cert_skills:
-            recommendations["certification_suggestions"].extend(cert_db[skill])
+            recommendations["certification_suggestions"].extend(_CERT_DB[skill])
         
-        recommendations["certification_suggestions"] = list(set(recommendations["certification_suggestions"]))[:5]
+        recommendations["certification_suggestions"] = list(dict.fromkeys(recommendations["certification_suggestions"]))[:5]
         
         return recommendations
     
@@ -240,7 +288,7 @@ class SkillAnalyzer:
         # Calculate breadth (number of unique skill categories)
         active_categories = sum(1 for cat, skills in profile.categorized_skills.items() 
                                 if skills and cat != "unknown")
-        max_categories = len([c for c in SKILL_CATEGORIES.keys()])
+        max_categories = len(SKILL_CATEGORIES)
         analysis["breadth_score"] = round(active_categories / max_categories, 2)
         
         # Calculate depth (skills per category)
@@ -262,7 +310,7 @@ class SkillAnalyzer:
         
         # Identify strength areas
         sorted_categories = sorted(skills_per_category.items(), 
-                                    key=lambda x: x[1], reverse=True)
+                                    key=itemgetter(1), reverse=True)
         analysis["strength_areas"] = [cat for cat, count in sorted_categories[:3] if count >= 2]
         
         # Identify weak areas (categories with few or no skills)
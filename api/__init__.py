@@ -1,6 +1,6 @@
 """
 API Package for Resume Intelligence Engine
 """
-from .resume_api import ResumeIntelligenceAPI
+from .resume_api import ResumeIntelligenceAPI, cached_analyze_resume, get_api
 
-__all__ = ["ResumeIntelligenceAPI"]
+__all__ = ["ResumeIntelligenceAPI", "cached_analyze_resume", "get_api"]
@@ -2,14 +2,39 @@
 Main API for Resume Intelligence Engine
 """
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 from dataclasses import asdict
+from collections import OrderedDict
+from copy import deepcopy
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
 import json
+import os
+import re
+import tempfile
+import threading
+
+# Use the Rust-backed orjson serializer for exports when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from parsers import ResumeParser
 from analyzers import SkillAnalyzer, ExperienceAnalyzer, JobRecommender
 from scorer import QualityScorer
 
+# Seniority cues in a job description; words must stand alone so "sr" does not
+# match inside "msrp", while year counts match anywhere (e.g. "15+ years")
+_SENIOR_JOB_RE = re.compile(r"(?<!\w)(?:senior|sr)(?!\w)|[57]\+ years")
+_JUNIOR_JOB_RE = re.compile(r"(?<!\w)(?:junior|jr|entry)(?!\w)|0-2 years|recent graduate")
+
+# Bump whenever parsing or analysis output changes so stale cached results are ignored
+_CACHE_VERSION = 1
+
 
 class ResumeIntelligenceAPI:
     """
@@ -19,16 +44,108 @@ class ResumeIntelligenceAPI:
         api = ResumeIntelligenceAPI()
         result = api.analyze_resume("path/to/resume.pdf")
         print(result)
+    
+    Pass parallel=True to run independent analysis stages on a thread pool.
+    The stages are pure Python, so this only shortens wall-clock time where
+    they can actually overlap (free-threaded builds, or callers blocked on I/O).
+    Call close(), or use the API as a context manager, to stop the pool:
+    
+        with ResumeIntelligenceAPI(parallel=True) as api:
+            result = api.analyze_resume("path/to/resume.pdf")
     """
     
-    def __init__(self):
+    # Maximum number of parsed resume files kept in the cache
+    _CACHE_MAX = 128
+    
+    def __init__(self, parallel: bool = False):
         self.parser = ResumeParser
         self.skill_analyzer = SkillAnalyzer()
         self.experience_analyzer = ExperienceAnalyzer()
         self.job_recommender = JobRecommender()
         self.quality_scorer = QualityScorer()
+        
+        # LRU cache of parsed files and their profiles, keyed by path and file
+        # stat so an edited file is analyzed again; shared across web app threads
+        self._file_cache: "OrderedDict[tuple, Tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        self._executor = ThreadPoolExecutor(max_workers=2) if parallel else None
     
-    def analyze_resume(self, file_path: str, 
+    def close(self):
+        """Shut down the worker threads of a parallel API; later calls run serially"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+    
+    def __enter__(self) -> "ResumeIntelligenceAPI":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _run_pair(self, first, second) -> Tuple:
+        """Call two independent zero-argument stages, concurrently when parallel"""
+        if self._executor is None:
+            return first(), second()
+        
+        future = self._executor.submit(first)
+        second_result = second()
+        return future.result(), second_result
+    
+    def _analyze_file(self, file_path: Union[str, Path]) -> Tuple:
+        """
+        Parse a resume file and build its skill and experience profiles
+        
+        The cache keeps its own copy and every hit returns a fresh one, so a
+        caller mutating the objects or their to_dict() output can't change
+        later results for the same file.
+        """
+        path = file_path if isinstance(file_path, Path) else Path(file_path)
+        stat = path.stat()
+        cache_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        
+        with self._cache_lock:
+            cached = self._file_cache.get(cache_key)
+            if cached is not None:
+                self._file_cache.move_to_end(cache_key)
+        if cached is not None:
+            return deepcopy(cached)
+        
+        resume_data = self.parser.parse(path)
+        skill_profile, experience_profile = self._analyze_profiles(resume_data)
+        analyzed = (resume_data, skill_profile, experience_profile)
+        
+        with self._cache_lock:
+            self._file_cache[cache_key] = deepcopy(analyzed)
+            if len(self._file_cache) > self._CACHE_MAX:
+                self._file_cache.popitem(last=False)
+        
+        return analyzed
+    
+    def _analyze_profiles(self, resume_data) -> Tuple:
+        """Build the skill and experience profiles, which are independent"""
+        return self._run_pair(
+            lambda: self.skill_analyzer.analyze_skills(resume_data),
+            lambda: self.experience_analyzer.analyze_experience(resume_data)
+        )
+    
+    def _recommend_and_score(self, resume_data, skill_profile, experience_profile) -> Tuple:
+        """Recommend jobs and score the resume, which both only read the profiles"""
+        return self._run_pair(
+            lambda: self.job_recommender.recommend_jobs(skill_profile, experience_profile),
+            lambda: self.quality_scorer.score_resume(resume_data, skill_profile)
+        )
+    
+    def _analyze_core(self, file_path: Union[str, Path]) -> Tuple:
+        """Run the analyses every report needs: profiles, job matches and score"""
+        # Profiles are cached per file
+        resume_data, skill_profile, experience_profile = self._analyze_file(file_path)
+        job_recommendations, resume_score = self._recommend_and_score(
+            resume_data, skill_profile, experience_profile
+        )
+        return resume_data, skill_profile, experience_profile, job_recommendations, resume_score
+    
+    def analyze_resume(self, file_path: Union[str, Path], 
                       job_description: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze a complete resume and return comprehensive results
@@ -40,16 +157,9 @@ class ResumeIntelligenceAPI:
         Returns:
             Dictionary containing all analysis results
         """
-        # Parse resume
-        resume_data = self.parser.parse(Path(file_path))
-        
-        # Run all analyses
-        skill_profile = self.skill_analyzer.analyze_skills(resume_data)
-        experience_profile = self.experience_analyzer.analyze_experience(resume_data)
-        job_recommendations = self.job_recommender.recommend_jobs(
-            skill_profile, experience_profile
-        )
-        resume_score = self.quality_scorer.score_resume(resume_data, skill_profile)
+        # Parse resume and run the core analyses
+        (resume_data, skill_profile, experience_profile,
+         job_recommendations, resume_score) = self._analyze_core(file_path)
         
         # Build comprehensive result
         result = {
@@ -79,12 +189,10 @@ class ResumeIntelligenceAPI:
         """Analyze resume from text string"""
         resume_data = self.parser.parse_text(text, file_type)
         
-        skill_profile = self.skill_analyzer.analyze_skills(resume_data)
-        experience_profile = self.experience_analyzer.analyze_experience(resume_data)
-        job_recommendations = self.job_recommender.recommend_jobs(
-            skill_profile, experience_profile
+        skill_profile, experience_profile = self._analyze_profiles(resume_data)
+        job_recommendations, resume_score = self._recommend_and_score(
+            resume_data, skill_profile, experience_profile
         )
-        resume_score = self.quality_scorer.score_resume(resume_data, skill_profile)
         
         return {
             "basic_info": self._extract_basic_info(resume_data),
@@ -94,67 +202,86 @@ class ResumeIntelligenceAPI:
             "resume_score": resume_score.to_dict()
         }
     
-    def get_quick_analysis(self, file_path: str) -> Dict[str, Any]:
+    def get_quick_analysis(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """Get quick analysis summary"""
-        result = self.analyze_resume(file_path)
+        # Only the core analyses; the suggestion sections are not summarized
+        _, skill_profile, experience_profile, job_recommendations, resume_score = \
+            self._analyze_core(file_path)
+        score = resume_score.to_dict()
         
         return {
-            "overall_score": result["resume_score"]["overall_score"],
-            "grade": result["resume_score"]["grade"],
-            "career_level": result["experience_profile"]["career_level"],
+            "overall_score": score["overall_score"],
+            "grade": score["grade"],
+            "career_level": experience_profile.career_level,
             "top_job_recommendations": [
                 {
-                    "title": jr["title"],
-                    "match": f"{jr['skill_match_percentage']:.0f}%"
+                    "title": jr.title,
+                    "match": f"{jr.skill_match_percentage:.0f}%"
                 }
-                for jr in result["job_recommendations"][:3]
+                for jr in job_recommendations[:3]
+            ],
+            "key_skills": [
+                {"skill": skill, "category": category, "score": skill_score}
+                for skill, category, skill_score in skill_profile.primary_skills[:5]
             ],
-            "key_skills": result["skill_profile"]["primary_skills"][:5],
-            "main_strength": result["resume_score"]["strengths"][0] if result["resume_score"]["strengths"] else "N/A",
-            "main_improvement": result["resume_score"]["improvement_tips"][0] if result["resume_score"]["improvement_tips"] else "N/A"
+            "main_strength": score["strengths"][0] if score["strengths"] else "N/A",
+            "main_improvement": score["improvement_tips"][0] if score["improvement_tips"] else "N/A"
         }
     
-    def compare_with_job(self, file_path: str, job_description: str) -> Dict[str, Any]:
+    def compare_with_job(self, file_path: Union[str, Path], job_description: str) -> Dict[str, Any]:
         """Compare resume against a job description"""
-        result = self.analyze_resume(file_path, job_description)
+        # Job recommendations and suggestions don't feed the comparison
+        resume_data, skill_profile, experience_profile = self._analyze_file(file_path)
+        resume_score = self.quality_scorer.score_resume(resume_data, skill_profile)
+        
+        job_match = {}
+        if job_description:
+            job_match = self.quality_scorer.compare_with_job_description(
+                resume_data, job_description
+            )
         
         return {
-            "match_percentage": result.get("job_match_analysis", {}).get("match_percentage", 0),
-            "recommendation": result.get("job_match_analysis", {}).get("recommendation", ""),
-            "missing_requirements": result.get("job_match_analysis", {}).get("requirements_missing", []),
-            "matched_requirements": result.get("job_match_analysis", {}).get("requirements_found", []),
-            "resume_score": result["resume_score"]["overall_score"],
+            "match_percentage": job_match.get("match_percentage", 0),
+            "recommendation": job_match.get("recommendation", ""),
+            "missing_requirements": job_match.get("requirements_missing", []),
+            "matched_requirements": job_match.get("requirements_found", []),
+            "resume_score": round(resume_score.overall_score, 2),
             "career_level_match": self._check_career_level_match(
-                result["experience_profile"]["career_level"],
+                experience_profile.career_level,
                 job_description
             )
         }
     
-    def get_skill_gap_for_role(self, file_path: str, role: str) -> Dict[str, Any]:
+    def get_skill_gap_for_role(self, file_path: Union[str, Path], role: str) -> Dict[str, Any]:
         """Get detailed skill gap for a specific role"""
-        resume_data = self.parser.parse(Path(file_path))
-        skill_profile = self.skill_analyzer.analyze_skills(resume_data)
+        _, skill_profile, _ = self._analyze_file(file_path)
         
         return self.job_recommender.get_skill_gap_analysis(skill_profile, role)
     
-    def get_career_roadmap(self, file_path: str, target_role: str) -> Dict[str, Any]:
+    def get_career_roadmap(self, file_path: Union[str, Path], target_role: str) -> Dict[str, Any]:
         """Get career roadmap to reach target role"""
-        resume_data = self.parser.parse(Path(file_path))
-        skill_profile = self.skill_analyzer.analyze_skills(resume_data)
-        experience_profile = self.experience_analyzer.analyze_experience(resume_data)
+        _, skill_profile, experience_profile = self._analyze_file(file_path)
         
         return self.job_recommender.get_career_roadmap(
             skill_profile, experience_profile, target_role
         )
     
-    def export_report(self, file_path: str, output_path: str,
+    def export_report(self, file_path: Union[str, Path], output_path: str,
                      format: str = "json") -> str:
         """Export analysis report to file"""
-        result = self.analyze_resume(file_path)
-        
+        return self.save_report(self.analyze_resume(file_path), output_path, format=format)
+    
+    def save_report(self, result: Dict, output_path: str,
+                    format: str = "json") -> str:
+        """Write an analysis result from analyze_resume to file"""
         if format == "json":
-            with open(output_path, 'w') as f:
-                json.dump(result, f, indent=2)
+            if ORJSON_AVAILABLE:
+                Path(output_path).write_bytes(orjson.dumps(
+                    result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+            else:
+                with open(output_path, 'w') as f:
+                    json.dump(result, f, indent=2)
         elif format == "txt":
             self._export_text_report(result, output_path)
         else:
@@ -186,10 +313,7 @@ class ResumeIntelligenceAPI:
         """Check if candidate level matches job requirements"""
         job_lower = job_description.lower()
         
-        senior_keywords = ["senior", "sr", "5+ years", "7+ years"]
-        junior_keywords = ["junior", "jr", "entry", "0-2 years", "recent graduate"]
-        
-        if any(kw in job_lower for kw in senior_keywords):
+        if _SENIOR_JOB_RE.search(job_lower):
             if candidate_level in ["senior", "lead", "architect"]:
                 return "Good match"
             elif candidate_level == "mid-level":
@@ -197,7 +321,7 @@ class ResumeIntelligenceAPI:
             else:
                 return "May lack required experience"
         
-        if any(kw in job_lower for kw in junior_keywords):
+        if _JUNIOR_JOB_RE.search(job_lower):
             if candidate_level in ["fresher", "junior"]:
                 return "Good match"
             else:
@@ -207,38 +331,115 @@ class ResumeIntelligenceAPI:
     
     def _export_text_report(self, result: Dict, output_path: str):
         """Export analysis as readable text report"""
-        lines = []
-        lines.append("=" * 60)
-        lines.append("RESUME INTELLIGENCE REPORT")
-        lines.append("=" * 60)
+        lines = self._text_report_lines(result)
+        
+        # Stream lines to the file, newline-separated with no trailing newline
+        with open(output_path, 'w') as f:
+            f.write(next(lines))
+            f.writelines("\n" + line for line in lines)
+    
+    def _text_report_lines(self, result: Dict) -> Iterator[str]:
+        """Yield the lines of the readable text report"""
+        yield "=" * 60
+        yield "RESUME INTELLIGENCE REPORT"
+        yield "=" * 60
         
-        lines.append("\n📊 OVERALL SCORE")
-        lines.append(f"Grade: {result['resume_score']['grade']}")
-        lines.append(f"Score: {result['resume_score']['overall_score']}/100")
+        yield "\n📊 OVERALL SCORE"
+        yield f"Grade: {result['resume_score']['grade']}"
+        yield f"Score: {result['resume_score']['overall_score']}/100"
         
-        lines.append("\n👤 BASIC INFO")
+        yield "\n👤 BASIC INFO"
         basic = result['basic_info']
-        lines.append(f"Name: {basic['name']}")
-        lines.append(f"Email: {basic['email']}")
+        yield f"Name: {basic['name']}"
+        yield f"Email: {basic['email']}"
         
-        lines.append("\n💼 CAREER PROFILE")
+        yield "\n💼 CAREER PROFILE"
         exp = result['experience_profile']
-        lines.append(f"Level: {exp['career_level'].title()}")
-        lines.append(f"Experience: {exp['total_years_experience']} years")
+        yield f"Level: {exp['career_level'].title()}"
+        yield f"Experience: {exp['total_years_experience']} years"
         
-        lines.append("\n🎯 TOP JOB RECOMMENDATIONS")
+        yield "\n🎯 TOP JOB RECOMMENDATIONS"
         for i, jr in enumerate(result['job_recommendations'][:5], 1):
-            lines.append(f"{i}. {jr['title']} - {jr['skill_match_percentage']:.0f}% match")
+            yield f"{i}. {jr['title']} - {jr['skill_match_percentage']:.0f}% match"
         
-        lines.append("\n📈 STRENGTHS")
+        yield "\n📈 STRENGTHS"
         for strength in result['resume_score']['strengths'][:3]:
-            lines.append(f"✓ {strength}")
+            yield f"✓ {strength}"
         
-        lines.append("\n🔧 IMPROVEMENT TIPS")
+        yield "\n🔧 IMPROVEMENT TIPS"
         for tip in result['resume_score']['improvement_tips'][:3]:
-            lines.append(f"• {tip}")
-        
-        lines.append("\n" + "=" * 60)
+            yield f"• {tip}"
         
-        with open(output_path, 'w') as f:
-            f.write('\n'.join(lines))
+        yield "\n" + "=" * 60
+
+
+@lru_cache(maxsize=1)
+def get_api() -> ResumeIntelligenceAPI:
+    """
+    Return the process-wide API instance, building it on first use
+    
+    The analyzers and the parsed-file cache are shared by every caller, so
+    repeated CLI runs or library calls in one process skip the warm-up.
+    """
+    return ResumeIntelligenceAPI()
+
+
+def cached_analyze_resume(api: ResumeIntelligenceAPI, resume_path: Union[str, Path],
+                          use_cache: bool = True) -> Dict:
+    """Run api.analyze_resume, reusing the stored result for identical file contents"""
+    if not use_cache:
+        return api.analyze_resume(resume_path)
+    
+    from config.config import ensure_output_dir
+    
+    if not isinstance(resume_path, Path):
+        resume_path = Path(resume_path)
+    
+    # The result also depends on the engine version, the year "present" resolves
+    # to and the parser picked by the file type, so all of them join the key
+    digest = hashlib.blake2b(resume_path.read_bytes(), digest_size=16)
+    digest.update(
+        f"{_CACHE_VERSION}:{datetime.now().year}:{resume_path.suffix.lower()}".encode()
+    )
+    key = digest.hexdigest()
+    
+    try:
+        cache_dir = ensure_output_dir() / ".cache"
+        cache_dir.mkdir(exist_ok=True)
+    except OSError:
+        return api.analyze_resume(resume_path)
+    cache_path = cache_dir / f"{key}.json"
+    
+    try:
+        cached = cache_path.read_bytes()
+    except OSError:
+        cached = None
+    if cached is not None:
+        try:
+            return orjson.loads(cached) if ORJSON_AVAILABLE else json.loads(cached)
+        except ValueError:
+            pass
+    
+    result = api.analyze_resume(resume_path)
+    
+    # Write to a uniquely named temporary file first, so no other process or thread
+    # sharing this API can publish or read a partial entry
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=cache_dir, prefix=f"{key}.", suffix=".tmp",
+                                         delete=False) as f:
+            tmp_path = f.name
+            if ORJSON_AVAILABLE:
+                f.write(orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS))
+            else:
+                f.write(json.dumps(result, default=str).encode('utf-8'))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Caching is best effort; only clean up a leftover temporary file
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    
+    return result
@@ -1,14 +1,46 @@
 """
 CLI Interface for Resume Intelligence Engine
 """
-import argparse
+import json
 import sys
 from pathlib import Path
-from api.resume_api import ResumeIntelligenceAPI
+from types import SimpleNamespace
 
+# Use the Rust-backed orjson serializer for the verbose report when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def main():
-    """Main CLI entry point"""
+
+_QUICK_FLAGS = ("-q", "--quick")
+
+
+def _parse_simple_args(argv):
+    """Parse the common `resume [--quick]` shape without building the argparse parser"""
+    if len(argv) not in (1, 2) or argv[0].startswith("-"):
+        return None
+    if len(argv) == 2 and argv[1] not in _QUICK_FLAGS:
+        return None
+    
+    return SimpleNamespace(
+        resume=argv[0],
+        quick=len(argv) == 2,
+        job=None,
+        export=None,
+        format="json",
+        skill_gap=None,
+        roadmap=None,
+        verbose=False,
+        no_cache=False,
+    )
+
+
+def _build_parser():
+    """Build the full argument parser for the less common flagged forms"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Resume Intelligence Engine - Analyze and improve your resume",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -65,7 +97,20 @@ Examples:
         help="Show detailed analysis"
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-analyze the resume instead of reusing a cached result"
+    )
+    
+    return parser
+
+
+def main():
+    """Main CLI entry point"""
+    args = _parse_simple_args(sys.argv[1:])
+    if args is None:
+        args = _build_parser().parse_args()
     
     # Check if resume file exists
     resume_path = Path(args.resume)
@@ -73,49 +118,53 @@ Examples:
         print(f"Error: Resume file not found: {args.resume}")
         sys.exit(1)
     
-    # Initialize API
-    api = ResumeIntelligenceAPI()
+    # Check the job description too, before the engine is loaded
+    if args.job and not Path(args.job).exists():
+        print(f"Error: Job description file not found: {args.job}")
+        sys.exit(1)
+    
+    # Initialize API; imported here so --help and usage errors skip loading the engine
+    from api.resume_api import cached_analyze_resume, get_api
+    api = get_api()
     
     try:
+        result = None
+        if args.export:
+            # Export report; the analysis is reused by a full report requested alongside
+            result = cached_analyze_resume(api, resume_path, use_cache=not args.no_cache)
+            output_path = api.save_report(result, args.export, format=args.format)
+            print(f"Report exported to: {output_path}")
+        
         if args.quick:
             # Quick analysis
-            result = api.get_quick_analysis(args.resume)
+            result = api.get_quick_analysis(resume_path)
             print_quick_result(result)
         
         elif args.job:
             # Compare with job description
-            with open(args.job, 'r') as f:
-                job_description = f.read()
-            result = api.compare_with_job(args.resume, job_description)
+            job_description = Path(args.job).read_text(encoding='utf-8', errors='replace')
+            result = api.compare_with_job(resume_path, job_description)
             print_job_comparison(result)
         
         elif args.skill_gap:
             # Skill gap analysis
-            result = api.get_skill_gap_for_role(args.resume, args.skill_gap)
+            result = api.get_skill_gap_for_role(resume_path, args.skill_gap)
             print_skill_gap(result)
         
         elif args.roadmap:
             # Career roadmap
-            result = api.get_career_roadmap(args.resume, args.roadmap)
+            result = api.get_career_roadmap(resume_path, args.roadmap)
             print_roadmap(result)
         
-        elif args.export:
-            # Export report
-            output_path = api.export_report(
-                args.resume, 
-                args.export,
-                format=args.format
-            )
-            print(f"Report exported to: {output_path}")
-        
         elif args.verbose:
             # Full detailed analysis
-            result = api.analyze_resume(args.resume)
+            if result is None:
+                result = cached_analyze_resume(api, resume_path, use_cache=not args.no_cache)
             print_verbose_result(result)
         
-        else:
+        elif not args.export:
             # Default: Full analysis
-            result = api.analyze_resume(args.resume)
+            result = cached_analyze_resume(api, resume_path, use_cache=not args.no_cache)
             print_standard_result(result)
     
     except Exception as e:
@@ -123,174 +172,213 @@ Examples:
         sys.exit(1)
 
 
+# Report rules, built once; the _TOP variants start with a blank line
+_RULE50 = "=" * 50
+_RULE60 = "=" * 60
+_RULE50_TOP = "\n" + _RULE50
+_RULE60_TOP = "\n" + _RULE60
+
+# Multi-line entry templates for the report loops, parsed once at import
+_JOB_ENTRY = "\n{}\n  Match: {:.0f}%\n  Why fits: {}\n  Missing: {}".format
+_RESOURCE_ENTRY = "\n  {}:\n    Level: {}\n    Time: {}\n    Resources: {}".format
+_ROADMAP_STEP = "\n{}. {}\n   Timeline: {}\n   Outcome: {}\n   Actions:".format
+
+
+def _dumps(obj):
+    """Pretty-print an analysis section as JSON"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _emit(lines):
+    """Write the collected output lines to stdout with a single write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def print_quick_result(result):
     """Print quick analysis result"""
-    print("\n" + "=" * 50)
-    print("RESUME ANALYSIS - QUICK SUMMARY")
-    print("=" * 50)
-    
-    print(f"\n📊 Score: {result['overall_score']}/100 (Grade: {result['grade']})")
-    print(f"💼 Level: {result['career_level'].title()}")
+    out = []
+    out.append(_RULE50_TOP)
+    out.append("RESUME ANALYSIS - QUICK SUMMARY")
+    out.append(_RULE50)
+    
+    out.append(f"\n📊 Score: {result['overall_score']}/100 (Grade: {result['grade']})")
+    out.append(f"💼 Level: {result['career_level'].title()}")
+    
+    out.append("\n🎯 Top Job Recommendations:")
+    out.extend(
+        f"  • {rec['title']} - {rec['match']}"
+        for rec in result['top_job_recommendations']
+    )
     
-    print("\n🎯 Top Job Recommendations:")
-    for rec in result['top_job_recommendations']:
-        print(f"  • {rec['title']} - {rec['match']}")
+    out.append("\n🔑 Key Skills:")
+    out.extend(f"  • {skill['skill']} ({skill['category']})" for skill in result['key_skills'])
     
-    print("\n🔑 Key Skills:")
-    for skill in result['key_skills']:
-        print(f"  • {skill['skill']} ({skill['category']})")
+    out.append(f"\n✅ Strength: {result['main_strength']}")
+    out.append(f"💡 Tip: {result['main_improvement']}")
     
-    print(f"\n✅ Strength: {result['main_strength']}")
-    print(f"💡 Tip: {result['main_improvement']}")
+    out.append(_RULE50_TOP)
     
-    print("\n" + "=" * 50)
+    _emit(out)
 
 
 def print_standard_result(result):
     """Print standard analysis result"""
-    print("\n" + "=" * 60)
-    print("RESUME INTELLIGENCE ANALYSIS")
-    print("=" * 60)
+    out = []
+    out.append(_RULE60_TOP)
+    out.append("RESUME INTELLIGENCE ANALYSIS")
+    out.append(_RULE60)
     
     # Basic info
     basic = result['basic_info']
-    print(f"\n👤 {basic['name'] or 'Unknown'}")
-    print(f"   {basic['email'] or 'No email'}")
+    out.append(f"\n👤 {basic['name'] or 'Unknown'}")
+    out.append(f"   {basic['email'] or 'No email'}")
     
     # Score
     score = result['resume_score']
-    print(f"\n📊 Overall Score: {score['overall_score']}/100 (Grade: {score['grade']})")
+    out.append(f"\n📊 Overall Score: {score['overall_score']}/100 (Grade: {score['grade']})")
     
     # Experience
     exp = result['experience_profile']
-    print(f"\n💼 Career: {exp['career_level'].title()} ({exp['total_years_experience']} years)")
+    out.append(f"\n💼 Career: {exp['career_level'].title()} ({exp['total_years_experience']} years)")
     
     # Job recommendations
-    print("\n🎯 Job Recommendations:")
-    for i, jr in enumerate(result['job_recommendations'][:5], 1):
-        print(f"  {i}. {jr['title']} - {jr['skill_match_percentage']:.0f}% match")
+    out.append("\n🎯 Job Recommendations:")
+    out.extend(
+        f"  {i}. {jr['title']} - {jr['skill_match_percentage']:.0f}% match"
+        for i, jr in enumerate(result['job_recommendations'][:5], 1)
+    )
     
     # Top skills
-    print("\n🛠️ Top Skills:")
-    for skill in result['skill_profile']['primary_skills'][:5]:
-        print(f"  • {skill['skill']} ({skill['category']})")
+    out.append("\n🛠️ Top Skills:")
+    out.extend(
+        f"  • {skill['skill']} ({skill['category']})"
+        for skill in result['skill_profile']['primary_skills'][:5]
+    )
     
     # Strengths
-    print("\n✅ Strengths:")
-    for strength in score['strengths'][:3]:
-        print(f"  ✓ {strength}")
+    out.append("\n✅ Strengths:")
+    out.extend(f"  ✓ {strength}" for strength in score['strengths'][:3])
     
     # Improvement tips
-    print("\n💡 Improvement Tips:")
-    for tip in score['improvement_tips'][:3]:
-        print(f"  • {tip}")
+    out.append("\n💡 Improvement Tips:")
+    out.extend(f"  • {tip}" for tip in score['improvement_tips'][:3])
     
-    print("\n" + "=" * 60)
+    out.append(_RULE60_TOP)
+    
+    _emit(out)
 
 
 def print_verbose_result(result):
     """Print detailed analysis result"""
-    import json
-    
-    print("\n" + "=" * 60)
-    print("DETAILED RESUME ANALYSIS")
-    print("=" * 60)
+    out = []
+    out.append(_RULE60_TOP)
+    out.append("DETAILED RESUME ANALYSIS")
+    out.append(_RULE60)
     
-    print("\n📋 BASIC INFORMATION")
-    print(json.dumps(result['basic_info'], indent=2))
+    out.append("\n📋 BASIC INFORMATION")
+    out.append(_dumps(result['basic_info']))
     
-    print("\n💼 EXPERIENCE PROFILE")
-    print(json.dumps(result['experience_profile'], indent=2))
+    out.append("\n💼 EXPERIENCE PROFILE")
+    out.append(_dumps(result['experience_profile']))
     
-    print("\n🎯 JOB RECOMMENDATIONS")
+    out.append("\n🎯 JOB RECOMMENDATIONS")
     for jr in result['job_recommendations']:
-        print(f"\n{jr['title']}")
-        print(f"  Match: {jr['skill_match_percentage']:.0f}%")
-        print(f"  Why fits: {'; '.join(jr['why_fits'])}")
-        print(f"  Missing: {', '.join(jr['missing_critical_skills'][:3])}")
+        out.append(_JOB_ENTRY(
+            jr['title'],
+            jr['skill_match_percentage'],
+            '; '.join(jr['why_fits']),
+            ', '.join(jr['missing_critical_skills'][:3])
+        ))
     
-    print("\n📊 QUALITY SCORE")
-    print(json.dumps(result['resume_score'], indent=2))
+    out.append("\n📊 QUALITY SCORE")
+    out.append(_dumps(result['resume_score']))
     
-    print("\n📈 SKILL PROFILE")
-    print(json.dumps(result['skill_profile'], indent=2))
+    out.append("\n📈 SKILL PROFILE")
+    out.append(_dumps(result['skill_profile']))
     
-    print("\n💡 SUGGESTIONS")
-    print(json.dumps(result['suggestions'], indent=2))
+    out.append("\n💡 SUGGESTIONS")
+    out.append(_dumps(result['suggestions']))
     
-    print("\n" + "=" * 60)
+    out.append(_RULE60_TOP)
+    
+    _emit(out)
 
 
 def print_job_comparison(result):
     """Print job comparison result"""
-    print("\n" + "=" * 50)
-    print("JOB MATCH ANALYSIS")
-    print("=" * 50)
+    out = []
+    out.append(_RULE50_TOP)
+    out.append("JOB MATCH ANALYSIS")
+    out.append(_RULE50)
+    
+    out.append(f"\n📊 Match: {result['match_percentage']:.0f}%")
+    out.append(f"💡 Recommendation: {result['recommendation']}")
+    out.append(f"🎯 Level Match: {result['career_level_match']}")
     
-    print(f"\n📊 Match: {result['match_percentage']:.0f}%")
-    print(f"💡 Recommendation: {result['recommendation']}")
-    print(f"🎯 Level Match: {result['career_level_match']}")
+    out.append("\n✅ Matched Requirements:")
+    out.extend(f"  ✓ {req}" for req in result['matched_requirements'][:5])
     
-    print("\n✅ Matched Requirements:")
-    for req in result['matched_requirements'][:5]:
-        print(f"  ✓ {req}")
+    out.append("\n❌ Missing Requirements:")
+    out.extend(f"  ✗ {req}" for req in result['missing_requirements'][:5])
     
-    print("\n❌ Missing Requirements:")
-    for req in result['missing_requirements'][:5]:
-        print(f"  ✗ {req}")
+    out.append("\n📊 Resume Score: {}/100".format(result['resume_score']))
     
-    print("\n📊 Resume Score: {}/100".format(result['resume_score']))
+    out.append(_RULE50_TOP)
     
-    print("\n" + "=" * 50)
+    _emit(out)
 
 
 def print_skill_gap(result):
     """Print skill gap analysis"""
-    print("\n" + "=" * 50)
-    print(f"SKILL GAP ANALYSIS - {result['target_role']}")
-    print("=" * 50)
+    out = []
+    out.append(_RULE50_TOP)
+    out.append(f"SKILL GAP ANALYSIS - {result['target_role']}")
+    out.append(_RULE50)
     
-    print(f"\n📊 Match: {result['match_percentage']}%")
+    out.append(f"\n📊 Match: {result['match_percentage']}%")
     
-    print("\n✅ Matched Skills:")
-    for skill in result['matched_skills']:
-        print(f"  ✓ {skill}")
+    out.append("\n✅ Matched Skills:")
+    out.extend(f"  ✓ {skill}" for skill in result['matched_skills'])
     
-    print("\n❌ Critical Missing:")
-    for skill in result['critical_missing_skills']:
-        print(f"  ✗ {skill}")
+    out.append("\n❌ Critical Missing:")
+    out.extend(f"  ✗ {skill}" for skill in result['critical_missing_skills'])
     
-    print("\n📚 Learning Resources:")
+    out.append("\n📚 Learning Resources:")
     for skill, resources in result['learning_resources'].items():
-        print(f"\n  {skill}:")
-        print(f"    Level: {resources['level']}")
-        print(f"    Time: {resources['time_estimate']}")
-        print(f"    Resources: {', '.join(resources['resources'][:2])}")
+        out.append(_RESOURCE_ENTRY(
+            skill,
+            resources['level'],
+            resources['time_estimate'],
+            ', '.join(resources['resources'][:2])
+        ))
+    
+    out.append(f"\n⏱️ Time to Job Ready: {result['time_to_job_ready']}")
     
-    print(f"\n⏱️ Time to Job Ready: {result['time_to_job_ready']}")
+    out.append(_RULE50_TOP)
     
-    print("\n" + "=" * 50)
+    _emit(out)
 
 
 def print_roadmap(result):
     """Print career roadmap"""
-    print("\n" + "=" * 50)
-    print(f"CAREER ROADMAP - {result['target_role']}")
-    print("=" * 50)
+    out = []
+    out.append(_RULE50_TOP)
+    out.append(f"CAREER ROADMAP - {result['target_role']}")
+    out.append(_RULE50)
     
-    print(f"\n📍 Current: {result['current_level'].title()}")
-    print(f"🎯 Target: {result['target_role']} ({result['target_level']})")
+    out.append(f"\n📍 Current: {result['current_level'].title()}")
+    out.append(f"🎯 Target: {result['target_role']} ({result['target_level']})")
     
-    print("\n📝 Steps:")
+    out.append("\n📝 Steps:")
     for i, step in enumerate(result['steps'], 1):
-        print(f"\n{i}. {step['phase']}")
-        print(f"   Timeline: {step['timeline']}")
-        print(f"   Outcome: {step['outcome']}")
-        print("   Actions:")
-        for action in step['actions']:
-            print(f"     • {action}")
-    
-    print("\n" + "=" * 50)
+        out.append(_ROADMAP_STEP(i, step['phase'], step['timeline'], step['outcome']))
+        out.extend(f"     • {action}" for action in step['actions'])
+    
+    out.append(_RULE50_TOP)
+    
+    _emit(out)
 
 
 if __name__ == "__main__":
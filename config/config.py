@@ -2,6 +2,8 @@
 Configuration for Resume Intelligence Engine
 """
 import os
+import sys
+from bisect import bisect_right
 from pathlib import Path
 
 # Project paths
@@ -9,8 +11,12 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 OUTPUT_DIR = PROJECT_ROOT / "output"
 
-# Create output directory if not exists
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+def ensure_output_dir() -> Path:
+    """Create the output directory on first write rather than at import"""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    return OUTPUT_DIR
+
 
 # Skill categories - including non-technical skills
 SKILL_CATEGORIES = {
@@ -123,6 +129,42 @@ SKILL_CATEGORIES = {
     ]
 }
 
+# The vocabulary lives for the whole process, so intern it and freeze the lists
+SKILL_CATEGORIES = {
+    sys.intern(category): tuple(sys.intern(skill) for skill in skills)
+    for category, skills in SKILL_CATEGORIES.items()
+}
+
+# Lowercased skill -> category; a skill listed under several categories keeps the first
+SKILL_TO_CATEGORY = {}
+for _category, _skills in SKILL_CATEGORIES.items():
+    for _skill in _skills:
+        SKILL_TO_CATEGORY.setdefault(sys.intern(_skill.lower()), _category)
+del _category, _skills, _skill
+
+# Every known skill, lowercased
+SKILL_SET = frozenset(SKILL_TO_CATEGORY)
+
+# Known skills in SKILL_CATEGORIES order, once each, for find_skills
+_KNOWN_SKILLS = tuple(dict.fromkeys(
+    skill for skills in SKILL_CATEGORIES.values() for skill in skills
+))
+_KNOWN_SKILL_MATCHER = None
+
+
+def find_skills(text: str) -> list:
+    """Return the known skills that occur anywhere in text, in SKILL_CATEGORIES order"""
+    global _KNOWN_SKILL_MATCHER
+    if _KNOWN_SKILL_MATCHER is None:
+        # Imported here: utils imports this module, so a top-level import would be circular
+        from utils.keyword_matcher import KeywordMatcher
+        _KNOWN_SKILL_MATCHER = KeywordMatcher(
+            (skill.lower(), index) for index, skill in enumerate(_KNOWN_SKILLS)
+        )
+    
+    found = _KNOWN_SKILL_MATCHER.find(text.lower())
+    return [_KNOWN_SKILLS[index] for index in sorted(found)]
+
 # Job roles database - including non-technical roles
 JOB_ROLES = {
     # Technical roles
@@ -262,6 +304,22 @@ JOB_ROLES = {
     }
 }
 
+for _role_data in JOB_ROLES.values():
+    _role_data["title"] = sys.intern(_role_data["title"])
+    _role_data["required_skills"] = tuple(sys.intern(s) for s in _role_data["required_skills"])
+    _role_data["keywords"] = tuple(sys.intern(k) for k in _role_data["keywords"])
+del _role_data
+
+# Lowercased required skills and keywords of each job role
+ROLE_REQUIRED_SETS = {
+    role_id: frozenset(sys.intern(skill.lower()) for skill in role_data["required_skills"])
+    for role_id, role_data in JOB_ROLES.items()
+}
+ROLE_KEYWORD_SETS = {
+    role_id: frozenset(keyword.lower() for keyword in role_data["keywords"])
+    for role_id, role_data in JOB_ROLES.items()
+}
+
 # Experience level thresholds (in years)
 EXPERIENCE_THRESHOLDS = {
     "fresher": 0,
@@ -272,6 +330,17 @@ EXPERIENCE_THRESHOLDS = {
     "architect": 10
 }
 
+# Levels sorted by their minimum years, so a years count can be bisected
+_THRESHOLDS = tuple(sorted(EXPERIENCE_THRESHOLDS.items(), key=lambda item: item[1]))
+_THRESHOLD_LEVELS = tuple(level for level, _ in _THRESHOLDS)
+_THRESHOLD_YEARS = tuple(years for _, years in _THRESHOLDS)
+
+
+def level_for_years(years: float) -> str:
+    """Return the highest experience level whose minimum years is met"""
+    return _THRESHOLD_LEVELS[max(bisect_right(_THRESHOLD_YEARS, years) - 1, 0)]
+
+
 # ATS keywords by industry - including non-technical
 ATS_KEYWORDS = {
     "technology": ["agile", "scrum", "ci/cd", "devops", "microservices", "api", "cloud"],
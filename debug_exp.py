@@ -1,23 +1,30 @@
 #!/usr/bin/env python
-from parsers.txt_parser import TxtParser
-from analyzers.experience_analyzer import ExperienceAnalyzer
 from pathlib import Path
 
-parser = TxtParser(Path('sample_resume.txt'))
-data = parser.parse()
 
-print('=== RAW DURATIONS ===')
-for exp in data.experiences:
-    print(f'Duration: [{exp.duration}]')
+def _main():
+    from parsers.txt_parser import TxtParser
+    from analyzers.experience_analyzer import ExperienceAnalyzer
+    
+    parser = TxtParser(Path('sample_resume.txt'))
+    data = parser.parse()
 
-analyzer = ExperienceAnalyzer()
-profile = analyzer.analyze_experience(data)
+    print('=== RAW DURATIONS ===')
+    for exp in data.experiences:
+        print(f'Duration: [{exp.duration}]')
 
-print('\n=== EXPERIENCE PROFILE ===')
-print(f'Total years: {profile.total_years}')
-print(f'Career level: {profile.career_level}')
-print(f'Domain expertise: {profile.domain_expertise}')
-print(f'Role specialization: {profile.role_specialization}')
+    analyzer = ExperienceAnalyzer()
+    profile = analyzer.analyze_experience(data)
 
-print('\n=== EXPERIENCES IN DATA ===')
-print(f'Number of experiences: {len(data.experiences)}')
+    print('\n=== EXPERIENCE PROFILE ===')
+    print(f'Total years: {profile.total_years}')
+    print(f'Career level: {profile.career_level}')
+    print(f'Domain expertise: {profile.domain_expertise}')
+    print(f'Role specialization: {profile.role_specialization}')
+
+    print('\n=== EXPERIENCES IN DATA ===')
+    print(f'Number of experiences: {len(data.experiences)}')
+
+
+if __name__ == "__main__":
+    _main()
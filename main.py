@@ -2,12 +2,12 @@
 """
 Main Entry Point for Resume Intelligence Engine
 """
-from api.resume_api import ResumeIntelligenceAPI
+from api.resume_api import cached_analyze_resume, get_api
 
 
 def main():
     """Main entry point"""
-    api = ResumeIntelligenceAPI()
+    api = get_api()
     
     # Example usage
     print("Resume Intelligence Engine")
@@ -16,11 +16,16 @@ def main():
     # You can use this to test with a resume file
     import sys
     
-    if len(sys.argv) > 1:
-        resume_path = sys.argv[1]
+    # --no-cache re-analyzes instead of reusing a stored result
+    args = sys.argv[1:]
+    use_cache = "--no-cache" not in args
+    args = [arg for arg in args if arg != "--no-cache"]
+    
+    if args:
+        resume_path = args[0]
         print(f"\nAnalyzing: {resume_path}")
         
-        result = api.analyze_resume(resume_path)
+        result = cached_analyze_resume(api, resume_path, use_cache=use_cache)
         
         print(f"\n[SCORE] Overall Score: {result['resume_score']['overall_score']}/100")
         print(f"[GRADE] Grade: {result['resume_score']['grade']}")
@@ -38,7 +43,7 @@ def main():
         for tip in result['resume_score']['improvement_tips'][:3]:
             print(f"  * {tip}")
     else:
-        print("Usage: python main.py <resume_file>")
+        print("Usage: python main.py <resume_file> [--no-cache]")
         print("\nSupported formats: PDF, DOCX, TXT")
         print("\nOr use the CLI:")
         print("  python -m cli.resume_cli resume.pdf --quick")
@@ -1,10 +1,9 @@
 """
 Resume Parsers Package
 """
+import importlib
+
 from .base_parser import BaseParser, ResumeParser
-from .pdf_parser import PDFParser
-from .docx_parser import DOCXParser
-from .txt_parser import TxtParser
 
 __all__ = [
     "BaseParser",
@@ -13,3 +12,16 @@ __all__ = [
     "DOCXParser",
     "TxtParser"
 ]
+
+# Format parsers pull in PDF/DOCX libraries, so import them on first access
+_LAZY_PARSERS = {
+    "PDFParser": ".pdf_parser",
+    "DOCXParser": ".docx_parser",
+    "TxtParser": ".txt_parser",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_PARSERS:
+        return getattr(importlib.import_module(_LAZY_PARSERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
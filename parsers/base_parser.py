@@ -1,13 +1,80 @@
 """
 Base Parser for Resume Intelligence Engine
 """
+import importlib
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
+from utils.keyword_matcher import KeywordMatcher
+from utils.compat import DATACLASS_SLOTS
+from config.config import find_skills
 
-@dataclass
+
+def _any_of(patterns) -> "re.Pattern":
+    """Fuse compiled patterns into one alternation, so a yes/no test is one regex call"""
+    return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns))
+
+
+# Text cleanup and contact patterns, compiled once at import
+_WS_RE = re.compile(r'[ \t]+')
+_JUNK_RE = re.compile(r'[^\w\s.,@\-\n]')
+# _JUNK_RE's deletions for ASCII text, applied with str.translate
+_JUNK_ASCII_TABLE = {code: None for code in range(128) if _JUNK_RE.match(chr(code))}
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RES = (
+    re.compile(r'\+?1?\s?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}'),
+    re.compile(r'\+?\d{1,3}[\s.-]?\d{2,4}[\s.-]?\d{2,4}[\s.-]?\d{2,4}'),
+)
+# Profile links in one pass; the lookahead is zero-width, so a link nested in
+# another (a LinkedIn URL inside an https:// website match) is still found
+_LINKS_RE = re.compile(
+    r'(?=(?P<linkedin>linkedin\.com/in/[\w-]+)'
+    r'|(?P<github>github\.com/[\w-]+)'
+    r'|(?P<website>https?://(?:www\.)?[\w-]+\.[\w./-]+))'
+)
+
+# Experience and education line patterns used by ResumeParser.parse_text
+_ROLE_RES = (
+    re.compile(r'^(senior|junior|lead|principal|staff)?\s*(software|data|web|devops|cloud|frontend|backend|fullstack|mobile)?\s*(engineer|developer|analyst|designer|architect|manager|director|specialist|consultant)'),
+    re.compile(r'^(software|data|web|devops|cloud)?\s*(engineer|developer|analyst)'),
+    re.compile(r'^(intern|trainee|associate)'),
+)
+_COMPANY_RES = (
+    re.compile(r'(inc|llc|ltd|corp|corporation|company|co\.)'),
+    re.compile(r'(technologies|tech|solutions|services|systems|software)'),
+    re.compile(r'(google|amazon|microsoft|apple|facebook|netflix|meta|ibm|oracle)'),
+    re.compile(r'(startup|ventures|group|partners|agency|studio)'),
+)
+_DATE_RANGE_RE = re.compile(r'\d{4}\s*(to|-|–)\s*(present|current|\d{4})')
+_DEGREE_RES = (
+    re.compile(r"(bachelor|master|phd|bs|ba|ms|ma|mba|phd|associate|b\.?s\.?|b\.?a\.?|m\.?s\.?|m\.?a\.?|m\.?b\.?a\.?|ph\.?d\.?)"),
+    re.compile(r"(b\.?tech|m\.?tech|b\.?e\.?|m\.?e\.?)"),
+    re.compile(r"(computer science|engineering|mathematics|physics|information technology|software engineering|data science|ai|machine learning)"),
+)
+_ROLE_RE = _any_of(_ROLE_RES)
+_COMPANY_RE = _any_of(_COMPANY_RES)
+# Yes/no degree test; extraction still tries _DEGREE_RES in order of preference
+_DEGREE_RE = _any_of(_DEGREE_RES)
+
+# Header lines that are never the candidate's name
+_NAME_SKIP_WORDS = frozenset({
+    'summary', 'experience', 'education', 'skills', 'certifications', 'projects',
+    'contact', 'email', 'phone', 'linkedin', 'github', 'resume', 'cv'
+})
+
+# Section heading keywords, matched as substrings of a lowercased line
+_SECTION_MATCHER = KeywordMatcher.from_mapping({
+    "experience": ["experience", "work history", "professional experience",
+                   "employment history", "work experience"],
+    "education": ["education", "academic", "degree", "university", "college"],
+    "school": ["school"],
+})
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Experience:
     """Data class for work experience"""
     role: str = ""
@@ -26,7 +93,7 @@ class Experience:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Education:
     """Data class for education"""
     degree: str = ""
@@ -45,7 +112,7 @@ class Education:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Certification:
     """Data class for certifications"""
     name: str = ""
@@ -64,7 +131,7 @@ class Certification:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Project:
     """Data class for projects"""
     name: str = ""
@@ -83,7 +150,7 @@ class Project:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ResumeData:
     """Complete resume data structure"""
     # Basic info
@@ -122,6 +189,9 @@ class ResumeData:
     file_path: Optional[Path] = None
     file_type: str = ""
     
+    # Memo for ExperienceAnalyzer's lowercased text (a declared field, since the class may use slots)
+    _full_text_lower: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "full_name": self.full_name,
@@ -168,69 +238,235 @@ class BaseParser(ABC):
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text"""
         # Keep newlines for section detection, just normalize other whitespace
-        import re
         # Replace multiple spaces/tabs with single space, but preserve newlines
-        text = re.sub(r'[ \t]+', ' ', text)
-        # Remove special characters but keep basic punctuation and newlines
-        text = re.sub(r'[^\w\s.,@\-\n]', '', text)
+        text = _WS_RE.sub(' ', text)
+        # Remove special characters but keep basic punctuation and newlines;
+        # translate covers ASCII text, the regex handles Unicode word characters
+        if text.isascii():
+            text = text.translate(_JUNK_ASCII_TABLE)
+        else:
+            text = _JUNK_RE.sub('', text)
         return text.strip()
     
     def _extract_email(self, text: str) -> str:
         """Extract email address from text"""
-        import re
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return emails[0] if emails else ""
+        match = _EMAIL_RE.search(text)
+        return match.group() if match else ""
     
     def _extract_phone(self, text: str) -> str:
         """Extract phone number from text"""
-        import re
         # Match various phone formats
-        phone_patterns = [
-            r'\+?1?\s?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',
-            r'\+?\d{1,3}[\s.-]?\d{2,4}[\s.-]?\d{2,4}[\s.-]?\d{2,4}',
-        ]
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
-            if phones:
-                return phones[0].strip()
+        for pattern in _PHONE_RES:
+            match = pattern.search(text)
+            if match:
+                return match.group().strip()
         return ""
     
     def _extract_links(self, text: str) -> Dict[str, str]:
         """Extract LinkedIn, GitHub, and other links"""
-        import re
+        # First occurrence of each kind of link
+        first = {}
+        for match in _LINKS_RE.finditer(text):
+            kind = match.lastgroup
+            if kind not in first:
+                first[kind] = match.group(kind)
+                if len(first) == 3:
+                    break
+        
         links = {}
         
         # LinkedIn
-        linkedin = re.search(r'linkedin\.com/in/[\w-]+', text)
-        if linkedin:
-            links["linkedin"] = f"https://{linkedin.group()}"
+        if "linkedin" in first:
+            links["linkedin"] = f"https://{first['linkedin']}"
         
         # GitHub
-        github = re.search(r'github\.com/[\w-]+', text)
-        if github:
-            links["github"] = f"https://{github.group()}"
+        if "github" in first:
+            links["github"] = f"https://{first['github']}"
         
         # Website
-        website = re.search(r'https?://(?:www\.)?[\w-]+\.[\w./-]+', text)
-        if website:
-            url = website.group()
-            if 'linkedin' not in url and 'github' not in url:
-                links["website"] = url
+        url = first.get("website")
+        if url and 'linkedin' not in url and 'github' not in url:
+            links["website"] = url
         
         return links
 
 
+class _TextParser:
+    """Parser for resume text passed in directly rather than read from a file"""
+    
+    def __init__(self, text):
+        self.raw_text = text
+        self.file_path = None
+    
+    def parse(self) -> ResumeData:
+        """Parse text directly"""
+        resume_data = ResumeData()
+        resume_data.raw_text = self.raw_text
+        resume_data.file_path = None
+        resume_data.file_type = "txt"
+        
+        # Extract email
+        match = _EMAIL_RE.search(self.raw_text)
+        resume_data.email = match.group() if match else ""
+        
+        # Extract phone
+        match = _PHONE_RES[0].search(self.raw_text)
+        resume_data.phone = match.group() if match else ""
+        
+        # Split once; lowering the whole text keeps the lines aligned, since
+        # lowercasing never introduces a newline
+        lines = self.raw_text.split('\n')
+        lines_lower = self.raw_text.lower().split('\n')
+        
+        # Extract name
+        for line in lines[:10]:
+            line = line.strip()
+            if line and len(line.split()) <= 4:
+                if '@' not in line and not any(map(str.isdigit, line)):
+                    if line.lower() not in _NAME_SKIP_WORDS:
+                        resume_data.full_name = line
+                        break
+        
+        # Extract skills
+        resume_data.technical_skills = find_skills(self.raw_text)
+        
+        # Extract experiences and education in one pass over the lines
+        in_experience_section = False
+        in_education_section = False
+        current_experience = None
+        experiences = []
+        
+        for line, line_lower in zip(lines, lines_lower):
+            line_lower = line_lower.strip()
+            sections = _SECTION_MATCHER.find(line_lower)
+            
+            # Education lines; "school" opens the section but does not end experience
+            if "education" in sections or "school" in sections:
+                in_education_section = True
+            elif in_education_section and "experience" in sections:
+                in_education_section = False
+            elif in_education_section:
+                self._parse_education_line(resume_data, line, line_lower)
+            
+            # Check if we're entering an experience section
+            if "experience" in sections:
+                in_experience_section = True
+                continue
+            
+            # Check if we're entering a different section
+            if in_experience_section:
+                if "education" in sections:
+                    in_experience_section = False
+                    continue
+                
+                # Skip empty lines and section headers
+                if not line.strip():
+                    continue
+                if len(line.strip()) < 5:
+                    continue
+                
+                # Check if this looks like a role title
+                is_role = _ROLE_RE.search(line_lower) is not None
+                
+                # Check if this looks like a company
+                is_company = _COMPANY_RE.search(line_lower) is not None
+                
+                # Check for date pattern
+                has_dates = _DATE_RANGE_RE.search(line_lower)
+                
+                if is_role or is_company or has_dates:
+                    if current_experience:
+                        experiences.append(current_experience)
+                    
+                    # Create new experience
+                    current_experience = {
+                        'role': '',
+                        'company': '',
+                        'duration': '',
+                        'description': []
+                    }
+                    
+                    if has_dates:
+                        current_experience['duration'] = has_dates.group(0)
+                        # Remove dates from line
+                        line = _DATE_RANGE_RE.sub('', line).strip()
+                    
+                    if is_role:
+                        current_experience['role'] = line.strip()
+                    elif is_company:
+                        current_experience['company'] = line.strip()
+                    else:
+                        current_experience['description'].append(line.strip())
+                elif current_experience and line.strip():
+                    # This is likely a description line
+                    current_experience['description'].append(line.strip())
+        
+        # Add the last experience
+        if current_experience:
+            experiences.append(current_experience)
+        
+        # Convert to Experience objects
+        for exp in experiences:
+            if exp['role'] or exp['description']:
+                experience = Experience(
+                    role=exp['role'],
+                    company=exp['company'],
+                    duration=exp['duration'],
+                    description=' '.join(exp['description'])
+                )
+                resume_data.experiences.append(experience)
+        
+        return resume_data
+    
+    def _parse_education_line(self, resume_data, line, line_lower):
+        """Add an Education entry if a line in the education section names one"""
+        if not line.strip() or len(line.strip()) < 5:
+            return
+        
+        # Look for degree patterns
+        has_degree = _DEGREE_RE.search(line_lower) is not None
+        
+        if has_degree or 'university' in line_lower or 'college' in line_lower or 'institute' in line_lower:
+            # Extract degree
+            degree = ''
+            for pattern in _DEGREE_RES:
+                match = pattern.search(line_lower)
+                if match:
+                    degree = match.group(0)
+                    break
+            
+            # Extract university
+            university = line
+            # Clean up
+            if degree:
+                university = re.sub(degree, '', university, flags=re.IGNORECASE).strip()
+            
+            education = Education(
+                degree=degree,
+                institution=university,
+                year=''
+            )
+            resume_data.education.append(education)
+
+
 class ResumeParser:
     """Factory class for resume parsing"""
     
     _parsers = {}
     
+    # File type -> (module, class name) of parsers imported on first use
+    _lazy_parsers = {}
+    
     @classmethod
     def register_parser(cls, file_type: str, parser_class: type):
         """Register a parser for a specific file type"""
         cls._parsers[file_type.lower()] = parser_class
     
+    @classmethod
+    def register_lazy_parser(cls, file_type: str, module: str, class_name: str):
+        """Register a parser by import path, loading its module only when needed"""
+        cls._lazy_parsers[file_type.lower()] = (module, class_name)
+    
     @classmethod
     def get_parser(cls, file_path: Path) -> BaseParser:
         """Get appropriate parser for file type"""
@@ -239,6 +475,11 @@ class ResumeParser:
         # Remove the dot from suffix
         file_type = suffix[1:] if suffix.startswith('.') else suffix
         
+        if file_type not in cls._parsers and file_type in cls._lazy_parsers:
+            module, class_name = cls._lazy_parsers[file_type]
+            parser_class = getattr(importlib.import_module(module, __package__), class_name)
+            cls.register_parser(file_type, parser_class)
+        
         if file_type not in cls._parsers:
             raise ValueError(f"No parser available for file type: {file_type}")
         
@@ -253,239 +494,12 @@ class ResumeParser:
     @classmethod
     def parse_text(cls, text: str, file_type: str = "txt") -> ResumeData:
         """Parse resume from text string"""
-        # Create a temporary parser that works with text
         if file_type.lower() == "txt":
-            # Create a minimal parser-like object
-            from .txt_parser import TxtParser
-            
-            class TextParser:
-                def __init__(self, text):
-                    self.raw_text = text
-                    self.file_path = None
-                
-                def parse(self) -> ResumeData:
-                    """Parse text directly"""
-                    from .base_parser import ResumeData, Experience, Education, Certification, Project
-                    from config.config import SKILL_CATEGORIES
-                    import re
-                    
-                    resume_data = ResumeData()
-                    resume_data.raw_text = self.raw_text
-                    resume_data.file_path = None
-                    resume_data.file_type = "txt"
-                    
-                    # Extract email
-                    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                    emails = re.findall(email_pattern, self.raw_text)
-                    resume_data.email = emails[0] if emails else ""
-                    
-                    # Extract phone
-                    phone_pattern = r'\+?1?\s?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}'
-                    phones = re.findall(phone_pattern, self.raw_text)
-                    resume_data.phone = phones[0] if phones else ""
-                    
-                    # Extract name
-                    lines = self.raw_text.split('\n')
-                    for line in lines[:10]:
-                        line = line.strip()
-                        if line and len(line.split()) <= 4:
-                            if '@' not in line and not any(c.isdigit() for c in line):
-                                skip_words = ['summary', 'experience', 'education', 'skills', 
-                                             'certifications', 'projects', 'contact', 'email',
-                                             'phone', 'linkedin', 'github', 'resume', 'cv']
-                                if line.lower() not in skip_words:
-                                    resume_data.full_name = line
-                                    break
-                    
-                    # Extract skills
-                    all_known_skills = []
-                    for category in SKILL_CATEGORIES.values():
-                        all_known_skills.extend([s.lower() for s in category])
-                    
-                    found_skills = []
-                    text_lower = self.raw_text.lower()
-                    
-                    for skill in all_known_skills:
-                        if skill in text_lower:
-                            for category_skills in SKILL_CATEGORIES.values():
-                                for original_skill in category_skills:
-                                    if original_skill.lower() == skill and original_skill not in found_skills:
-                                        found_skills.append(original_skill)
-                                        break
-                    
-                    resume_data.technical_skills = list(set(found_skills))
-                    
-                    # Extract experiences
-                    experience_keywords = ['experience', 'work history', 'professional experience', 
-                                           'employment history', 'work experience']
-                    education_keywords = ['education', 'academic', 'degree', 'university', 'college']
-                    
-                    lines = self.raw_text.split('\n')
-                    in_experience_section = False
-                    current_experience = None
-                    experiences = []
-                    
-                    for i, line in enumerate(lines):
-                        line_lower = line.lower().strip()
-                        
-                        # Check if we're entering an experience section
-                        if any(kw in line_lower for kw in experience_keywords):
-                            in_experience_section = True
-                            continue
-                        
-                        # Check if we're entering a different section
-                        if in_experience_section:
-                            if any(kw in line_lower for kw in education_keywords):
-                                in_experience_section = False
-                                continue
-                            
-                            # Skip empty lines and section headers
-                            if not line.strip():
-                                continue
-                            if len(line.strip()) < 5:
-                                continue
-                            
-                            # Check if this looks like a role title
-                            role_patterns = [
-                                r'^(senior|junior|lead|principal|staff)?\s*(software|data|web|devops|cloud|frontend|backend|fullstack|mobile)?\s*(engineer|developer|analyst|designer|architect|manager|director|specialist|consultant)',
-                                r'^(software|data|web|devops|cloud)?\s*(engineer|developer|analyst)',
-                                r'^(intern|trainee|associate)'
-                            ]
-                            
-                            is_role = False
-                            for pattern in role_patterns:
-                                if re.search(pattern, line_lower):
-                                    is_role = True
-                                    break
-                            
-                            # Check if this looks like a company
-                            company_patterns = [
-                                r'(inc|llc|ltd|corp|corporation|company|co\.)',
-                                r'(technologies|tech|solutions|services|systems|software)',
-                                r'(google|amazon|microsoft|apple|facebook|netflix|meta|ibm|oracle)',
-                                r'(startup|ventures|group|partners|agency|studio)'
-                            ]
-                            
-                            is_company = False
-                            for pattern in company_patterns:
-                                if re.search(pattern, line_lower):
-                                    is_company = True
-                                    break
-                            
-                            # Check for date pattern
-                            date_pattern = r'\d{4}\s*(to|-|–)\s*(present|current|\d{4})'
-                            has_dates = re.search(date_pattern, line_lower)
-                            
-                            if is_role or is_company or has_dates:
-                                if current_experience:
-                                    experiences.append(current_experience)
-                                
-                                # Create new experience
-                                current_experience = {
-                                    'role': '',
-                                    'company': '',
-                                    'duration': '',
-                                    'description': []
-                                }
-                                
-                                if has_dates:
-                                    match = re.search(date_pattern, line_lower)
-                                    if match:
-                                        current_experience['duration'] = match.group(0)
-                                        # Remove dates from line
-                                        line = re.sub(date_pattern, '', line).strip()
-                                
-                                if is_role:
-                                    current_experience['role'] = line.strip()
-                                elif is_company:
-                                    current_experience['company'] = line.strip()
-                                else:
-                                    current_experience['description'].append(line.strip())
-                            elif current_experience and line.strip():
-                                # This is likely a description line
-                                current_experience['description'].append(line.strip())
-                    
-                    # Add the last experience
-                    if current_experience:
-                        experiences.append(current_experience)
-                    
-                    # Convert to Experience objects
-                    from .base_parser import Experience
-                    for exp in experiences:
-                        if exp['role'] or exp['description']:
-                            experience = Experience(
-                                role=exp['role'],
-                                company=exp['company'],
-                                duration=exp['duration'],
-                                description=' '.join(exp['description'])
-                            )
-                            resume_data.experiences.append(experience)
-                    
-                    # Extract education
-                    education_keywords = ['education', 'academic', 'degree', 'university', 'college', 'school']
-                    in_education_section = False
-                    
-                    for line in lines:
-                        line_lower = line.lower().strip()
-                        
-                        if any(kw in line_lower for kw in education_keywords):
-                            in_education_section = True
-                            continue
-                        
-                        if in_education_section:
-                            # Check if we hit a different section
-                            if any(kw in line_lower for kw in experience_keywords):
-                                in_education_section = False
-                                continue
-                            
-                            if not line.strip() or len(line.strip()) < 5:
-                                continue
-                            
-                            # Look for degree patterns
-                            degree_patterns = [
-                                r"(bachelor|master|phd|bs|ba|ms|ma|mba|phd|associate|b\.?s\.?|b\.?a\.?|m\.?s\.?|m\.?a\.?|m\.?b\.?a\.?|ph\.?d\.?)",
-                                r"(b\.?tech|m\.?tech|b\.?e\.?|m\.?e\.?)",
-                                r"(computer science|engineering|mathematics|physics|information technology|software engineering|data science|ai|machine learning)"
-                            ]
-                            
-                            has_degree = any(re.search(p, line_lower) for p in degree_patterns)
-                            
-                            if has_degree or 'university' in line_lower or 'college' in line_lower or 'institute' in line_lower:
-                                from .base_parser import Education
-                                
-                                # Extract degree
-                                degree = ''
-                                for pattern in degree_patterns:
-                                    match = re.search(pattern, line_lower, re.IGNORECASE)
-                                    if match:
-                                        degree = match.group(0)
-                                        break
-                                
-                                # Extract university
-                                university = line
-                                # Clean up
-                                if degree:
-                                    university = re.sub(degree, '', university, flags=re.IGNORECASE).strip()
-                                
-                                education = Education(
-                                    degree=degree,
-                                    institution=university,
-                                    year=''
-                                )
-                                resume_data.education.append(education)
-                    
-                    return resume_data
-            
-            parser = TextParser(text)
-            return parser.parse()
+            return _TextParser(text).parse()
         raise ValueError(f"Cannot parse text format: {file_type}")
 
 
-# Register built-in parsers
-from .pdf_parser import PDFParser
-from .docx_parser import DOCXParser
-from .txt_parser import TxtParser
-
-ResumeParser.register_parser("pdf", PDFParser)
-ResumeParser.register_parser("docx", DOCXParser)
-ResumeParser.register_parser("txt", TxtParser)
+# Register built-in parsers; their PDF/DOCX libraries load on first use
+ResumeParser.register_lazy_parser("pdf", ".pdf_parser", "PDFParser")
+ResumeParser.register_lazy_parser("docx", ".docx_parser", "DOCXParser")
+ResumeParser.register_lazy_parser("txt", ".txt_parser", "TxtParser")
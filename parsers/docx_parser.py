@@ -6,6 +6,13 @@ from docx import Document
 from .base_parser import BaseParser, ResumeData, Experience, Education, Certification, Project
 
 
+# Header lines that are never the candidate's name
+_NAME_SKIP_WORDS = frozenset({
+    'summary', 'experience', 'education', 'skills', 'certifications', 'projects',
+    'contact', 'email', 'phone', 'linkedin', 'github'
+})
+
+
 class DOCXParser(BaseParser):
     """Parser for DOCX resume files"""
     
@@ -69,12 +76,9 @@ class DOCXParser(BaseParser):
             for i, line in enumerate(lines[:10]):
                 line = line.strip()
                 if line and len(line.split()) <= 4:
-                    if '@' not in line and not any(c.isdigit() for c in line):
+                    if '@' not in line and not any(map(str.isdigit, line)):
                         # Skip lines that look like section headers
-                        skip_words = ['summary', 'experience', 'education', 'skills', 
-                                     'certifications', 'projects', 'contact', 'email',
-                                     'phone', 'linkedin', 'github']
-                        if line.lower() not in skip_words:
+                        if line.lower() not in _NAME_SKIP_WORDS:
                             return line
         return ""
     
@@ -95,24 +99,9 @@ class DOCXParser(BaseParser):
     
     def _extract_skills(self, text: str) -> list:
         """Extract skills from resume text"""
-        from config.config import SKILL_CATEGORIES
-        
-        all_known_skills = []
-        for category in SKILL_CATEGORIES.values():
-            all_known_skills.extend([s.lower() for s in category])
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in all_known_skills:
-            if skill in text_lower:
-                for category_skills in SKILL_CATEGORIES.values():
-                    for original_skill in category_skills:
-                        if original_skill.lower() == skill and original_skill not in found_skills:
-                            found_skills.append(original_skill)
-                            break
+        from config.config import find_skills
         
-        return list(set(found_skills))
+        return find_skills(text)
     
     def _extract_section(self, text: str, section_name: str) -> str:
         """Extract a specific section from the resume"""
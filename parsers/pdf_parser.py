@@ -1,8 +1,7 @@
 """
 PDF Parser for Resume Intelligence Engine
 """
-from pathlib import Path
-from .base_parser import ResumeData, Experience, Education, Certification, Project
+from .base_parser import BaseParser, ResumeData, Experience, Education, Certification, Project
 
 # Try multiple PDF libraries
 PDF_PARSER = None
@@ -19,15 +18,18 @@ except ImportError:
     pass
 
 
-class PDFParser:
+# Header lines that are never the candidate's name
+_NAME_SKIP_WORDS = frozenset({
+    'summary', 'experience', 'education', 'skills', 'certifications', 'projects',
+    'contact', 'email', 'phone', 'linkedin', 'github', 'resume', 'cv'
+})
+
+
+class PDFParser(BaseParser):
     """Parser for PDF resume files"""
     
     SUPPORTED_FORMATS = ["pdf"]
     
-    def __init__(self, file_path: Path):
-        self.file_path = file_path
-        self.raw_text = ""
-    
     def parse(self) -> ResumeData:
         """Parse PDF resume and extract all relevant information"""
         self.raw_text = self._extract_text()
@@ -99,15 +101,6 @@ class PDFParser:
                 text_parts.append(text)
         return self._clean_text(" ".join(text_parts))
     
-    def _clean_text(self, text: str) -> str:
-        """Clean and normalize extracted text"""
-        import re
-        # Replace multiple spaces/tabs with single space
-        text = re.sub(r'[ \t]+', ' ', text)
-        # Remove special characters but keep basic punctuation and newlines
-        text = re.sub(r'[^\w\s.,@\-\n]', '', text)
-        return text.strip()
-    
     def _extract_email(self, text: str) -> str:
         """Extract email address from text"""
         import re
@@ -150,11 +143,8 @@ class PDFParser:
             for i, line in enumerate(lines[:10]):
                 line = line.strip()
                 if line and len(line.split()) <= 4:
-                    if '@' not in line and not any(c.isdigit() for c in line):
-                        skip_words = ['summary', 'experience', 'education', 'skills', 
-                                     'certifications', 'projects', 'contact', 'email',
-                                     'phone', 'linkedin', 'github', 'resume', 'cv']
-                        if line.lower() not in skip_words:
+                    if '@' not in line and not any(map(str.isdigit, line)):
+                        if line.lower() not in _NAME_SKIP_WORDS:
                             return line
         return ""
     
@@ -180,24 +170,9 @@ class PDFParser:
     
     def _extract_skills(self, text: str) -> list:
         """Extract skills from resume text"""
-        from config.config import SKILL_CATEGORIES
-        
-        all_known_skills = []
-        for category in SKILL_CATEGORIES.values():
-            all_known_skills.extend([s.lower() for s in category])
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in all_known_skills:
-            if skill in text_lower:
-                for category_skills in SKILL_CATEGORIES.values():
-                    for original_skill in category_skills:
-                        if original_skill.lower() == skill and original_skill not in found_skills:
-                            found_skills.append(original_skill)
-                            break
+        from config.config import find_skills
         
-        return list(set(found_skills))
+        return find_skills(text)
     
     def _extract_experiences(self, text: str) -> list:
         """Extract work experience entries"""
@@ -3,6 +3,32 @@ TXT Parser for Resume Intelligence Engine
 """
 from pathlib import Path
 from .base_parser import BaseParser, ResumeData, Experience, Education, Certification, Project
+from utils.keyword_matcher import KeywordMatcher
+
+
+# Section headers that are never the candidate's name
+_NAME_SKIP_WORDS = frozenset({
+    'summary', 'experience', 'education', 'skills', 'certifications', 'projects',
+    'contact', 'resume', 'curriculum'
+})
+
+
+def _header_matcher(headers) -> KeywordMatcher:
+    """Substring matcher telling whether a lowercased line names any of the headers"""
+    return KeywordMatcher((header, header) for header in headers)
+
+
+# Section headings that open each section, and the headings that end it
+_EXPERIENCE_HEADERS = _header_matcher(
+    ['experience', 'employment', 'work history', 'professional experience'])
+_EXPERIENCE_END = _header_matcher(
+    ['education', 'skills', 'certifications', 'projects', 'awards', 'publications'])
+_EDUCATION_HEADERS = _header_matcher(['education', 'academic', 'qualifications'])
+_EDUCATION_END = _header_matcher(['experience', 'skills', 'certifications', 'projects', 'awards'])
+_CERTIFICATION_HEADERS = _header_matcher(['certifications', 'certificates', 'licenses'])
+_CERTIFICATION_END = _header_matcher(['experience', 'education', 'skills', 'projects'])
+_PROJECT_HEADERS = _header_matcher(['projects', 'portfolio', 'personal projects'])
+_PROJECT_END = _header_matcher(['experience', 'education', 'skills', 'certifications'])
 
 
 class TxtParser(BaseParser):
@@ -64,13 +90,11 @@ class TxtParser(BaseParser):
             # Skip lines that look like contact info
             if '@' in line or 'email' in line.lower():
                 continue
-            if any(c.isdigit() for c in line):
+            if any(map(str.isdigit, line)):
                 continue
             
             # Skip section headers
-            skip_words = ['summary', 'experience', 'education', 'skills', 
-                         'certifications', 'projects', 'contact', 'resume', 'curriculum']
-            if line.lower() in skip_words:
+            if line.lower() in _NAME_SKIP_WORDS:
                 continue
             
             # Name should have 2-4 words
@@ -104,24 +128,9 @@ class TxtParser(BaseParser):
     
     def _extract_skills(self, text: str) -> list:
         """Extract skills from resume text"""
-        from config.config import SKILL_CATEGORIES
-        
-        all_known_skills = []
-        for category in SKILL_CATEGORIES.values():
-            all_known_skills.extend([s.lower() for s in category])
+        from config.config import find_skills
         
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in all_known_skills:
-            if skill in text_lower:
-                for category_skills in SKILL_CATEGORIES.values():
-                    for original_skill in category_skills:
-                        if original_skill.lower() == skill and original_skill not in found_skills:
-                            found_skills.append(original_skill)
-                            break
-        
-        return list(set(found_skills))
+        return find_skills(text)
     
     def _extract_experiences(self, text: str) -> list:
         """Extract work experience entries"""
@@ -134,21 +143,20 @@ class TxtParser(BaseParser):
         in_exp_section = False
         exp_lines = []
         
-        section_headers = ['experience', 'employment', 'work history', 'professional experience']
-        other_sections = ['education', 'skills', 'certifications', 'projects', 'awards', 'publications']
-        
-        for i, line in enumerate(lines):
+        for line in lines:
+            # Headings are short and have no colon; check that before matching
+            is_heading = ':' not in line and len(line) < 30
             line_lower = line.strip().lower()
             
             # Check if we're starting a new section
-            if any(header in line_lower for header in section_headers) and ':' not in line and len(line) < 30:
+            if is_heading and _EXPERIENCE_HEADERS.matches(line_lower):
                 in_exp_section = True
                 exp_lines = []
                 continue
             
             # Check if we've hit another section
             if in_exp_section:
-                if any(header in line_lower for header in other_sections) and ':' not in line and len(line) < 30:
+                if is_heading and _EXPERIENCE_END.matches(line_lower):
                     break
                 exp_lines.append(line)
         
@@ -264,19 +272,17 @@ class TxtParser(BaseParser):
         in_edu_section = False
         edu_lines = []
         
-        section_headers = ['education', 'academic', 'qualifications']
-        other_sections = ['experience', 'skills', 'certifications', 'projects', 'awards']
-        
         for line in lines:
+            is_heading = ':' not in line and len(line) < 25
             line_lower = line.strip().lower()
             
-            if any(header in line_lower for header in section_headers) and ':' not in line and len(line) < 25:
+            if is_heading and _EDUCATION_HEADERS.matches(line_lower):
                 in_edu_section = True
                 edu_lines = []
                 continue
             
             if in_edu_section:
-                if any(header in line_lower for header in other_sections) and ':' not in line and len(line) < 25:
+                if is_heading and _EDUCATION_END.matches(line_lower):
                     break
                 edu_lines.append(line)
         
@@ -325,19 +331,17 @@ class TxtParser(BaseParser):
         in_cert_section = False
         cert_lines = []
         
-        section_headers = ['certifications', 'certificates', 'licenses']
-        other_sections = ['experience', 'education', 'skills', 'projects']
-        
         for line in lines:
+            is_heading = ':' not in line and len(line) < 25
             line_lower = line.strip().lower()
             
-            if any(header in line_lower for header in section_headers) and ':' not in line and len(line) < 25:
+            if is_heading and _CERTIFICATION_HEADERS.matches(line_lower):
                 in_cert_section = True
                 cert_lines = []
                 continue
             
             if in_cert_section:
-                if any(header in line_lower for header in other_sections) and ':' not in line and len(line) < 25:
+                if is_heading and _CERTIFICATION_END.matches(line_lower):
                     break
                 cert_lines.append(line)
         
@@ -366,19 +370,17 @@ class TxtParser(BaseParser):
         in_proj_section = False
         proj_lines = []
         
-        section_headers = ['projects', 'portfolio', 'personal projects']
-        other_sections = ['experience', 'education', 'skills', 'certifications']
-        
         for line in lines:
+            is_heading = ':' not in line and len(line) < 25
             line_lower = line.strip().lower()
             
-            if any(header in line_lower for header in section_headers) and ':' not in line and len(line) < 25:
+            if is_heading and _PROJECT_HEADERS.matches(line_lower):
                 in_proj_section = True
                 proj_lines = []
                 continue
             
             if in_proj_section:
-                if any(header in line_lower for header in other_sections) and ':' not in line and len(line) < 25:
+                if is_heading and _PROJECT_END.matches(line_lower):
                     break
                 proj_lines.append(line)
         
@@ -4,6 +4,25 @@ Resume Quality Scorer for Resume Intelligence Engine
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 from config.config import SCORING_WEIGHTS, ATS_KEYWORDS
+from utils.keyword_matcher import KeywordMatcher
+
+# ATS-friendly keywords by category
+_ATS_KEYWORDS = {
+    "technology": ["agile", "scrum", "ci/cd", "devops", "microservices", "api", "cloud",
+                   "python", "java", "javascript", "sql", "git", "docker", "kubernetes"],
+    "general": ["leadership", "teamwork", "communication", "problem-solving", "analytical",
+                "project management", "stakeholder", "strategy", "innovation"],
+    "soft_skills": ["collaboration", "adaptability", "critical thinking", "time management",
+                    "attention to detail", "organization", "multitasking"]
+}
+
+# Substring matcher over every (category, keyword) pair, scanned once per resume
+_ATS_MATCHER = KeywordMatcher(
+    (keyword, (category, keyword))
+    for category, keywords in _ATS_KEYWORDS.items()
+    for keyword in keywords
+)
+_ATS_KEYWORD_TOTAL = sum(len(keywords) for keywords in _ATS_KEYWORDS.values())
 
 
 @dataclass
@@ -74,14 +93,7 @@ class QualityScorer:
     ]
     
     # ATS-friendly keywords by category
-    ATS_KEYWORDS = {
-        "technology": ["agile", "scrum", "ci/cd", "devops", "microservices", "api", "cloud",
-                       "python", "java", "javascript", "sql", "git", "docker", "kubernetes"],
-        "general": ["leadership", "teamwork", "communication", "problem-solving", "analytical",
-                    "project management", "stakeholder", "strategy", "innovation"],
-        "soft_skills": ["collaboration", "adaptability", "critical thinking", "time management",
-                        "attention to detail", "organization", "multitasking"]
-    }
+    ATS_KEYWORDS = _ATS_KEYWORDS
     
     def __init__(self):
         self.weights = SCORING_WEIGHTS
@@ -177,20 +189,13 @@ class QualityScorer:
         text = resume_data.raw_text.lower()
         
         # Count found keywords
-        total_keywords = 0
-        found_keywords = 0
-        
-        for category_keywords in self.ATS_KEYWORDS.values():
-            for keyword in category_keywords:
-                total_keywords += 1
-                if keyword.lower() in text:
-                    found_keywords += 1
+        found_keywords = len(_ATS_MATCHER.find(text))
         
         # Calculate score
-        if total_keywords == 0:
+        if _ATS_KEYWORD_TOTAL == 0:
             return 50
         
-        keyword_score = (found_keywords / total_keywords) * 100
+        keyword_score = (found_keywords / _ATS_KEYWORD_TOTAL) * 100
         
         # Bonus for skill variety
         skill_count = len(resume_data.technical_skills) + len(resume_data.soft_skills)
@@ -342,8 +347,9 @@ class QualityScorer:
         # Keyword tips
         if keyword < 70:
             tips.append("Research and include more industry-specific keywords")
+            found = _ATS_MATCHER.find(resume_data.raw_text.lower())
             for category, keywords in self.ATS_KEYWORDS.items():
-                relevant = [k for k in keywords if k not in resume_data.raw_text.lower()]
+                relevant = [k for k in keywords if (category, k) not in found]
                 if relevant:
                     tips.append(f"Consider adding: {', '.join(relevant[:3])}")
         
@@ -0,0 +1,71 @@
+"""
+Keyword matching tests for the Experience Analyzer
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from parsers.base_parser import Experience, ResumeData
+from analyzers import ExperienceAnalyzer
+
+
+def _analyze(role="", company="", description="", summary=""):
+    """Analyze a resume with a single experience entry"""
+    resume_data = ResumeData(
+        summary=summary,
+        experiences=[Experience(role=role, company=company, duration="2019 - 2021",
+                                description=description)]
+    )
+    return ExperienceAnalyzer().analyze_experience(resume_data)
+
+
+def test_domain_keywords_match_longer_words():
+    """Domain keywords still count when a word continues past them"""
+    profile = _analyze(role="Coordinator", description="Shipped pharmaceutical tooling")
+    assert "healthcare" in profile.domain_expertise
+
+    profile = _analyze(role="Coordinator", description="Healthcare claims")
+    assert "healthcare" in profile.domain_expertise
+
+
+def test_role_keywords_match_longer_words():
+    """Plural and extended role titles keep their role type"""
+    profile = _analyze(role="Developers Guild Member")
+    assert profile.role_specialization == "developer"
+
+
+def test_company_keywords_match_longer_words():
+    """Company names that start with a keyword are classified"""
+    profile = _analyze(role="Coordinator", company="StartupXYZ")
+    assert profile.company_types == ["startup"]
+
+
+def test_keywords_must_start_a_word():
+    """Keywords inside another word are ignored"""
+    # "ngo" inside "mongodb" and "ui" inside "build"
+    profile = _analyze(role="Build Coordinator", company="Mongodb Corp")
+    assert "non_profit" not in profile.company_types
+    assert profile.role_specialization == "general"
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_domain_keywords_match_longer_words,
+        test_role_keywords_match_longer_words,
+        test_company_keywords_match_longer_words,
+        test_keywords_must_start_a_word,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+    print("✅ ALL TESTS PASSED!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,148 @@
+"""
+Tests for the shared Keyword Matcher
+
+Every case runs against each available backend: the pyahocorasick automaton
+when it is installed, and always the pure-Python fallback.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils import keyword_matcher
+from utils.keyword_matcher import KeywordMatcher
+
+
+def _matchers(keywords, **options):
+    """Build the same matcher on every available backend, as (name, matcher) pairs"""
+    keywords = list(keywords)
+    matchers = []
+    if keyword_matcher.AHOCORASICK_AVAILABLE:
+        matchers.append(("automaton", KeywordMatcher(keywords, **options)))
+
+    saved = keyword_matcher.AHOCORASICK_AVAILABLE
+    keyword_matcher.AHOCORASICK_AVAILABLE = False
+    try:
+        matchers.append(("fallback", KeywordMatcher(keywords, **options)))
+    finally:
+        keyword_matcher.AHOCORASICK_AVAILABLE = saved
+    return matchers
+
+
+def test_substring_matching():
+    """Plain keywords match anywhere, including inside other words and each other"""
+    keywords = [("machine learning", "ml"), ("learning", "education"), ("java", "java")]
+    for name, matcher in _matchers(keywords):
+        assert matcher.find("deep machine learning") == {"ml", "education"}, name
+        assert matcher.find("javascript") == {"java"}, name
+        assert matcher.find("nothing here") == set(), name
+
+
+def test_whole_words():
+    """whole_words keywords must stand alone"""
+    keywords = [("java", "java"), ("c++", "cpp"), ("ai", "ai")]
+    for name, matcher in _matchers(keywords, whole_words=True):
+        assert matcher.find("java and c++") == {"java", "cpp"}, name
+        assert matcher.find("javascript, c++x, email") == set(), name
+        assert matcher.find("ai") == {"ai"}, name
+        assert matcher.find("(java)") == {"java"}, name
+
+
+def test_whole_words_nested_keywords():
+    """A keyword inside a longer matching keyword is still reported"""
+    keywords = [("fortune 500", "fortune_500"), ("fortune", "fortune"), ("500", "count")]
+    for name, matcher in _matchers(keywords, whole_words=True):
+        assert matcher.find("a fortune 500 firm") == {"fortune_500", "fortune", "count"}, name
+        assert matcher.find("fortunes") == set(), name
+
+
+def test_word_starts():
+    """word_starts keywords must begin a word but may run on into a longer one"""
+    keywords = [("health", "healthcare"), ("ngo", "non_profit"), ("ui", "designer")]
+    for name, matcher in _matchers(keywords, word_starts=True):
+        assert matcher.find("healthcare startup") == {"healthcare"}, name
+        assert matcher.find("mongodb build") == set(), name
+        assert matcher.find("ui/ux and ngos") == {"designer", "non_profit"}, name
+
+
+def test_word_starts_nested_keywords():
+    """Keywords sharing a start are all reported"""
+    keywords = [("admin", "admin"), ("administrator", "administrator")]
+    for name, matcher in _matchers(keywords, word_starts=True):
+        assert matcher.find("administrators") == {"admin", "administrator"}, name
+        assert matcher.find("sysadmin") == set(), name
+
+
+def test_values_shared_by_keywords():
+    """Several keywords can map to one value, and one keyword to several values"""
+    keywords = [("aws", "cloud"), ("azure", "cloud"), ("state", "government"),
+                ("state", "public")]
+    for name, matcher in _matchers(keywords, whole_words=True):
+        assert matcher.find("aws and azure") == {"cloud"}, name
+        assert matcher.find("state agency") == {"government", "public"}, name
+
+
+def test_matches():
+    """matches reports whether any keyword occurs"""
+    for options in ({}, {"whole_words": True}, {"word_starts": True}):
+        for name, matcher in _matchers([("lead", True), ("managed", True)], **options):
+            assert matcher.matches("managed a team"), (name, options)
+            assert not matcher.matches("worked alone"), (name, options)
+
+    for name, matcher in _matchers([("lead", True)], whole_words=True):
+        assert not matcher.matches("leadership"), name
+
+
+def test_find_ordered():
+    """find_ordered lists each value once, by the first occurrence of any of its keywords"""
+    keywords = [("health", "healthcare"), ("cloud", "technology"), ("software", "technology"),
+                ("bank", "finance")]
+    text = "software for banks, then cloud and health, then more banking"
+    for options in ({}, {"word_starts": True}):
+        for name, matcher in _matchers(keywords, **options):
+            assert matcher.find_ordered(text) == ["technology", "finance", "healthcare"], \
+                (name, options)
+
+    # A value reached through a keyword that ends later but starts earlier still comes first
+    keywords = [("machine learning", "ml"), ("learning", "education"), ("chin", "chin")]
+    for name, matcher in _matchers(keywords):
+        assert matcher.find_ordered("machine learning") == ["ml", "chin", "education"], name
+
+    keywords = [("data science", "science"), ("data", "data"), ("science", "field")]
+    for name, matcher in _matchers(keywords, whole_words=True):
+        assert matcher.find_ordered("data science") == ["data", "science", "field"], name
+
+
+def test_empty_matcher():
+    """A matcher without keywords finds nothing"""
+    for name, matcher in _matchers([]):
+        assert matcher.find("anything") == set(), name
+        assert matcher.find_ordered("anything") == [], name
+        assert not matcher.matches("anything"), name
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_substring_matching,
+        test_whole_words,
+        test_whole_words_nested_keywords,
+        test_word_starts,
+        test_word_starts_nested_keywords,
+        test_values_shared_by_keywords,
+        test_matches,
+        test_find_ordered,
+        test_empty_matcher,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+    print("✅ ALL TESTS PASSED!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -2,5 +2,7 @@
 Utilities Package for Resume Intelligence Engine
 """
 from .skill_normalizer import SkillNormalizer
+from .keyword_matcher import KeywordMatcher
+from .compat import DATACLASS_SLOTS
 
-__all__ = ["SkillNormalizer"]
+__all__ = ["SkillNormalizer", "KeywordMatcher", "DATACLASS_SLOTS"]
@@ -0,0 +1,7 @@
+"""
+Python Version Compatibility for Resume Intelligence Engine
+"""
+import sys
+
+# dataclass(slots=True) is only available on Python 3.10+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
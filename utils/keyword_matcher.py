@@ -0,0 +1,152 @@
+"""
+Keyword Matcher for Resume Intelligence Engine
+"""
+import re
+from operator import itemgetter
+from typing import Hashable, Iterable, Iterator, List, Set, Tuple
+
+# Use the C-backed Aho-Corasick automaton when available
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the definition of \\w used by the regex fallback"""
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """Find which keyword buckets occur in a text with a single pass"""
+
+    def __init__(self, keywords: Iterable[Tuple[str, Hashable]], whole_words: bool = False,
+                 word_starts: bool = False):
+        """
+        Build the matcher from (keyword, value) pairs of lowercase keywords
+
+        whole_words only matches keywords that stand alone; word_starts only
+        requires a keyword to begin a word, so "health" matches "healthcare"
+        but "ngo" does not match "mongodb".
+        """
+        values_by_keyword = {}
+        for keyword, value in keywords:
+            values_by_keyword.setdefault(keyword, {})[value] = None
+
+        self.whole_words = whole_words
+        self.word_starts = word_starts
+        self._check_start = whole_words or word_starts
+        self._values_by_keyword = {
+            keyword: tuple(values)
+            for keyword, values in values_by_keyword.items()
+        }
+
+        self._automaton = None
+        self._pattern = None
+        self._substrings = None
+
+        if not self._values_by_keyword:
+            return
+
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, values in self._values_by_keyword.items():
+                self._automaton.add_word(keyword, (len(keyword), values))
+            self._automaton.make_automaton()
+        elif not self._check_start:
+            # A regex alternation can't report overlapping keywords, so plain
+            # substring matching tests each keyword with str.find instead
+            self._substrings = tuple(self._values_by_keyword.items())
+        else:
+            # A zero-width lookahead tries every word start, and longest keywords
+            # first make each try capture the longest keyword that fits there
+            alternation = "|".join(
+                re.escape(keyword)
+                for keyword in sorted(self._values_by_keyword, key=len, reverse=True)
+            )
+            end = r"(?!\w)" if whole_words else ""
+            self._pattern = re.compile(r"(?<!\w)(?=(" + alternation + r")" + end + r")")
+            # The alternation reports one keyword per start, so keep the shorter
+            # keywords that also match wherever a longer one does
+            self._nested = {
+                keyword: self._nested_hits(keyword)
+                for keyword in self._values_by_keyword
+            }
+
+    def _nested_hits(self, keyword: str) -> Tuple[Tuple[int, Tuple[Hashable, ...]], ...]:
+        """(length, values) of the keywords that match wherever keyword does, itself last"""
+        hits = []
+        for length in range(1, len(keyword)):
+            values = self._values_by_keyword.get(keyword[:length])
+            if values is None:
+                continue
+            if self.whole_words and _is_word_char(keyword[length]):
+                continue
+            hits.append((length, values))
+        hits.append((len(keyword), self._values_by_keyword[keyword]))
+        return tuple(hits)
+
+    @classmethod
+    def from_mapping(cls, mapping, whole_words: bool = False,
+                     word_starts: bool = False) -> "KeywordMatcher":
+        """Build a matcher from a {value: [keywords]} mapping"""
+        return cls(
+            (
+                (keyword, value)
+                for value, keywords in mapping.items()
+                for keyword in keywords
+            ),
+            whole_words=whole_words,
+            word_starts=word_starts,
+        )
+
+    def _iter_hits(self, text_lower: str) -> Iterator[Tuple[int, int, Tuple[Hashable, ...]]]:
+        """
+        Yield (start, length, values) for keyword occurrences in lowercase text
+
+        Every backend reports the first occurrence of each keyword, though not
+        in text order; some also report later occurrences.
+        """
+        if self._automaton is not None:
+            last = len(text_lower) - 1
+            for end, (length, values) in self._automaton.iter(text_lower):
+                start = end - length + 1
+                if self._check_start:
+                    if start > 0 and _is_word_char(text_lower[start - 1]):
+                        continue
+                    if self.whole_words and end < last and _is_word_char(text_lower[end + 1]):
+                        continue
+                yield start, length, values
+        elif self._substrings is not None:
+            for keyword, values in self._substrings:
+                position = text_lower.find(keyword)
+                if position >= 0:
+                    yield position, len(keyword), values
+        elif self._pattern is not None:
+            nested = self._nested
+            for match in self._pattern.finditer(text_lower):
+                start = match.start()
+                for length, values in nested[match.group(1)]:
+                    yield start, length, values
+
+    def find(self, text_lower: str) -> Set[Hashable]:
+        """Return the values of all keywords found in lowercase text"""
+        found = set()
+        for _, _, values in self._iter_hits(text_lower):
+            found.update(values)
+        return found
+
+    def find_ordered(self, text_lower: str) -> List[Hashable]:
+        """Return the values of all keywords found, in order of first occurrence"""
+        # Order by where each keyword starts, shorter first, so every backend agrees
+        hits = sorted(self._iter_hits(text_lower), key=itemgetter(0, 1))
+        return list(dict.fromkeys(
+            value
+            for _, _, values in hits
+            for value in values
+        ))
+
+    def matches(self, text_lower: str) -> bool:
+        """Check whether any keyword occurs in lowercase text"""
+        return next(self._iter_hits(text_lower), None) is not None
@@ -1,20 +1,29 @@
 """
 Skill Normalizer for Resume Intelligence Engine
 """
+import sys
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from config.config import SKILL_CATEGORIES
+from config.config import SKILL_CATEGORIES, SKILL_TO_CATEGORY
 
+# (skill, lowercased skill) pairs per category, lowercased once at import
+_CATEGORY_SKILLS_LOWER = {
+    category: tuple((skill, sys.intern(skill.lower())) for skill in skills)
+    for category, skills in SKILL_CATEGORIES.items()
+}
 
-@dataclass
+
+@dataclass(frozen=True)
 class NormalizedSkill:
-    """Normalized skill data structure"""
+    """Normalized skill data structure, immutable since normalize() results are cached and shared"""
     original: str
     normalized: str
     category: str
     confidence: float  # 0.0 to 1.0
     is_alias: bool
-    aliases: List[str]
+    aliases: Tuple[str, ...]
 
 
 class SkillNormalizer:
@@ -152,20 +161,65 @@ class SkillNormalizer:
         "junior", "new to", "currently learning", "in progress", "async"
     ]
     
+    # Capitalization for names that title() gets wrong
+    SPECIAL_CASES = {
+        "css": "CSS",
+        "html": "HTML",
+        "sql": "SQL",
+        "api": "API",
+        "aws": "AWS",
+        "gcp": "GCP",
+        "mongodb": "MongoDB",
+        "graphql": "GraphQL",
+        "restful": "REST API",
+        "cicd": "CI/CD",
+        "devops": "DevOps",
+        "ml": "ML",
+        "ai": "AI",
+        "nlp": "NLP",
+    }
+    
+    # Categories by importance when ranking primary skills, highest first
+    PRIORITY_CATEGORIES = (
+        "programming_languages",
+        "frameworks_libraries",
+        "tools_platforms",
+        "data_science",
+        "devops_cloud",
+        "soft_skills"
+    )
+    _CATEGORY_BOOST = dict(zip(PRIORITY_CATEGORIES, range(len(PRIORITY_CATEGORIES), 0, -1)))
+    
+    # Normalized skill -> aliases, built on first construction and shared
+    _REVERSE_MAPPING: Optional[Dict[str, Tuple[str, ...]]] = None
+    
     def __init__(self):
         """Initialize skill normalizer with all categories"""
         self._build_reverse_mapping()
+        
+        # The same skill strings recur across sections and in categorize/scoring
+        # calls, so remember each result (lru_cache is thread-safe)
+        self._normalize_cached = lru_cache(maxsize=4096)(self._normalize)
     
     def _build_reverse_mapping(self):
-        """Build reverse mapping from normalized to aliases"""
-        self._reverse_mapping = {}
-        for alias, normalized in self.SKILL_ALIASES.items():
-            if normalized not in self._reverse_mapping:
-                self._reverse_mapping[normalized] = []
-            self._reverse_mapping[normalized].append(alias)
+        """Build reverse mapping from normalized to aliases, once per class"""
+        cls = type(self)
+        if cls.__dict__.get("_REVERSE_MAPPING") is None:
+            reverse_mapping = {}
+            for alias, normalized in cls.SKILL_ALIASES.items():
+                reverse_mapping.setdefault(normalized, []).append(alias)
+            cls._REVERSE_MAPPING = {
+                normalized: tuple(aliases) for normalized, aliases in reverse_mapping.items()
+            }
+        
+        self._reverse_mapping = cls._REVERSE_MAPPING
     
     def normalize(self, skill: str) -> NormalizedSkill:
         """Normalize a single skill"""
+        return self._normalize_cached(skill)
+    
+    def _normalize(self, skill: str) -> NormalizedSkill:
+        """Normalize a single skill without the cache"""
         skill_lower = skill.lower().strip()
         
         # Check if it's an alias
@@ -178,7 +232,7 @@ class SkillNormalizer:
                 category=category,
                 confidence=1.0,
                 is_alias=True,
-                aliases=self._reverse_mapping.get(normalized, [])
+                aliases=self._reverse_mapping.get(normalized, ())
             )
         
         # Check if it's already a normalized name
@@ -192,7 +246,7 @@ class SkillNormalizer:
                 category=category,
                 confidence=0.95,
                 is_alias=False,
-                aliases=[]
+                aliases=()
             )
         
         # Unknown skill
@@ -202,7 +256,7 @@ class SkillNormalizer:
             category="unknown",
             confidence=0.5,
             is_alias=False,
-            aliases=[]
+            aliases=()
         )
     
     def normalize_list(self, skills: List[str]) -> List[NormalizedSkill]:
@@ -235,40 +289,18 @@ class SkillNormalizer:
     
     def _get_category(self, skill: str) -> str:
         """Get the category of a normalized skill"""
-        skill_lower = skill.lower()
-        
-        for category, category_skills in SKILL_CATEGORIES.items():
-            for category_skill in category_skills:
-                if category_skill.lower() == skill_lower:
-                    return category
-        return "unknown"
+        return SKILL_TO_CATEGORY.get(skill.lower(), "unknown")
     
     def _capitalize_skill(self, skill: str) -> str:
         """Capitalize skill name properly"""
         # Handle special cases
-        special_cases = {
-            "css": "CSS",
-            "html": "HTML",
-            "sql": "SQL",
-            "api": "API",
-            "aws": "AWS",
-            "gcp": "GCP",
-            "mongodb": "MongoDB",
-            "graphql": "GraphQL",
-            "restful": "REST API",
-            "cicd": "CI/CD",
-            "devops": "DevOps",
-            "ml": "ML",
-            "ai": "AI",
-            "nlp": "NLP",
-        }
-        
         skill_lower = skill.lower().strip()
-        if skill_lower in special_cases:
-            return special_cases[skill_lower]
+        if skill_lower in self.SPECIAL_CASES:
+            return self.SPECIAL_CASES[skill_lower]
         
-        # Title case for most skills
-        return skill.strip().title()
+        # Title case for most skills; interned since the same names recur in every
+        # profile and are compared and hashed in the set and dict operations
+        return sys.intern(skill.strip().title())
     
     def identify_primary_skills(self, skills: List[str], 
                                  experience_years: int = 0) -> List[Tuple[str, str, float]]:
@@ -289,32 +321,19 @@ class SkillNormalizer:
             skill_scores[key]["count"] += 1
         
         # Score skills based on frequency and category importance
-        priority_categories = [
-            "programming_languages",
-            "frameworks_libraries",
-            "tools_platforms",
-            "data_science",
-            "devops_cloud",
-            "soft_skills"
-        ]
-        
         scored_skills = []
         for skill, data in skill_scores.items():
             base_score = data["count"]
             
-            # Boost for high-priority categories
-            category = data["category"]
-            if category in priority_categories:
-                category_boost = len(priority_categories) - priority_categories.index(category)
-            else:
-                category_boost = 0  # No boost for unknown categories
+            # Boost for high-priority categories, none for unknown categories
+            category_boost = self._CATEGORY_BOOST.get(data["category"], 0)
             
             total_score = (base_score * 0.5) + (category_boost * 0.3) + (data["confidence"] * 0.2)
             
             scored_skills.append((skill, data["category"], round(total_score, 2)))
         
         # Sort by score descending
-        scored_skills.sort(key=lambda x: x[2], reverse=True)
+        scored_skills.sort(key=itemgetter(2), reverse=True)
         
         return scored_skills
     
@@ -343,18 +362,16 @@ class SkillNormalizer:
     def suggest_skill_expansion(self, skills: List[str], 
                                  category: str = "programming_languages") -> List[str]:
         """Suggest related skills based on existing skills"""
-        from config.config import SKILL_CATEGORIES
-        
         # Get related skills from the same category
-        category_skills = SKILL_CATEGORIES.get(category, [])
+        category_skills = _CATEGORY_SKILLS_LOWER.get(category, ())
         
         # Skills the user already has
-        user_skills_lower = [s.lower() for s in skills]
+        user_skills_lower = {s.lower() for s in skills}
         
-        suggestions = []
-        for skill in category_skills:
-            if skill.lower() not in user_skills_lower:
-                suggestions.append(skill)
+        suggestions = [
+            skill for skill, skill_lower in category_skills
+            if skill_lower not in user_skills_lower
+        ]
         
         return suggestions[:10]  # Return top 10 suggestions
     
@@ -383,7 +400,7 @@ class SkillNormalizer:
         normalized = self.normalize(skill)
         
         if normalized.normalized in self._reverse_mapping:
-            return self._reverse_mapping[normalized.normalized]
+            return list(self._reverse_mapping[normalized.normalized])
         
         return [skill]
     
@@ -8,8 +8,15 @@ import json
 import re
 from pathlib import Path
 
-from api.resume_api import ResumeIntelligenceAPI
-from config.config import SKILL_CATEGORIES
+# Use the Rust-backed orjson serializer for analysis responses when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from api.resume_api import get_api
+from config.config import SKILL_TO_CATEGORY
 
 app = Flask(__name__)
 app.secret_key = 'resume-intelligence-secret-key'
@@ -26,7 +33,18 @@ app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 # Initialize API
-api = ResumeIntelligenceAPI()
+api = get_api()
+
+
+def json_result(payload):
+    """JSON response for a full analysis result, serialized with orjson when available"""
+    if ORJSON_AVAILABLE:
+        # Sorted keys match jsonify's output
+        return app.response_class(
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+            mimetype="application/json"
+        )
+    return jsonify(payload)
 
 
 def allowed_file(filename):
@@ -37,17 +55,13 @@ def allowed_file(filename):
 def extract_job_keywords(job_description):
     """Extract potential skill keywords from job description"""
     job_lower = job_description.lower()
-    keywords = set()
-    
-    # Get all known skills from config
-    all_known_skills = []
-    for category in SKILL_CATEGORIES.values():
-        all_known_skills.extend([s.lower() for s in category])
+    # Keyed by keyword so duplicates collapse while keeping first-seen order
+    keywords = {}
     
     # Check for known skills in job description
-    for skill in all_known_skills:
+    for skill in SKILL_TO_CATEGORY:
         if skill in job_lower:
-            keywords.add(skill)
+            keywords[skill] = None
     
     # Also extract potential skills using patterns
     # Look for phrases like "experience with X", "knowledge of X", "proficient in X"
@@ -68,7 +82,7 @@ def extract_job_keywords(job_description):
             words = match.strip().split()
             for word in words:
                 if len(word) > 2 and word not in ['and', 'the', 'with', 'have', 'must', 'also']:
-                    keywords.add(word)
+                    keywords[word] = None
     
     return list(keywords)
 
@@ -164,7 +178,7 @@ def compare_job():
             primary_skills = [s.get('skill', '') if isinstance(s, dict) else str(s) 
                             for s in result.get('skill_profile', {}).get('primary_skills', [])]
             all_skills.extend(primary_skills)
-            resume_skill_set = set([s.lower() for s in all_skills])
+            resume_skills = list(dict.fromkeys(s.lower() for s in all_skills))
             
             # Extract keywords from job description
             job_keywords = extract_job_keywords(job_description)
@@ -176,7 +190,7 @@ def compare_job():
             for keyword in job_keywords:
                 # Check if any resume skill contains this keyword
                 is_matched = False
-                for skill in resume_skill_set:
+                for skill in resume_skills:
                     if keyword in skill or skill in keyword:
                         matched.append(keyword)
                         is_matched = True
@@ -210,7 +224,7 @@ def compare_job():
                 'total_years_experience': total_years,
                 'overall_score': overall_score,
                 'grade': grade,
-                'all_skills': list(resume_skill_set)[:10] if resume_skill_set else []
+                'all_skills': resume_skills[:10]
             }
             
             return render_template('compare.html', 
@@ -242,7 +256,7 @@ def analyze_api():
         
         try:
             result = api.analyze_resume(filepath)
-            return jsonify(result)
+            return json_result(result)
         except Exception as e:
             return jsonify({'error': str(e)}), 500
     
@@ -273,7 +287,7 @@ def compare_api():
             result, job_description
         )
         
-        return jsonify(job_match)
+        return json_result(job_match)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 